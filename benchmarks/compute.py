@@ -0,0 +1,179 @@
+"""Headless benchmark of every page's compute path on synthetic catalogs.
+
+For each catalog size it times the work behind the pages without a
+Streamlit server:
+
+* filtering: city/category/type/month filter and radius search
+* aggregation: cube build and multi-city lookups
+* forecasting: batched fit for every city
+* itinerary: planning for one city, and scheduling a three-city trip
+* card rendering: one page of place cards
+* recommendations: similarity and ranking
+
+The report is JSON keyed by size and path. Passing an earlier report as
+``--baseline`` prints the ratio for each path and fails when one has
+slowed down by more than ``--tolerance``.
+
+Usage::
+
+    python benchmarks/compute.py --sizes 1000 100000 1000000 --output bench-compute.json
+    python benchmarks/compute.py --baseline bench-compute.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+ITINERARY_PLACES = 60
+SCHEDULE_ROUNDS = 20
+CARDS_PER_PAGE = 24
+
+
+def timeit(func, repeat, setup=None):
+    """Wall times of ``repeat`` calls of ``func``; ``setup`` runs untimed before each."""
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {'median': statistics.median(times), 'min': min(times), 'runs': len(times)}
+
+
+def bench_size(rows, repeat, seed=0):
+    from tourism import forecast
+    from tourism.aggregates import AggregateCube
+    from tourism.recommend import Recommender
+    from tourism.routing import plan_itinerary
+    from tourism.schedule import schedule_trip
+    from tourism.store import PlaceStore
+    from tourism.synthetic import catalog_shape, generate_places
+    from views.common import create_place_grid
+
+    start = time.perf_counter()
+    df = generate_places(*catalog_shape(rows), seed=seed)
+    generate_seconds = time.perf_counter() - start
+
+    results = {}
+    results['store.build'] = timeit(lambda: PlaceStore(df), repeat)
+    store = PlaceStore(df)
+    city = store.cities[0]
+    lat, lon = (float(v) for v in store.city(city)[['latitude', 'longitude']].iloc[0])
+    categories = ['Historical', 'Religious']
+
+    results['filter.city'] = timeit(lambda: store.filter(city, categories, None, 11), repeat)
+    results['filter.all_cities'] = timeit(lambda: store.filter(None, categories, ['Fort', 'Temple'], 11), repeat)
+    results['filter.near'] = timeit(lambda: store.near(lat, lon, radius_km=25, k=24), repeat)
+
+    results['aggregate.build'] = timeit(lambda: AggregateCube(store.df), repeat)
+    cube = AggregateCube(store.df)
+    few = store.cities[:5]
+    results['aggregate.lookup'] = timeit(lambda: (cube.totals(few), cube.categories(few), cube.weather_for(few)), repeat)
+
+    for model in forecast.MODELS:
+        # The fit cache would turn every repeat after the first into a lookup
+        results[f'forecast.{model}'] = timeit(
+            lambda: forecast.Forecaster(store, model).predict_all(),
+            repeat,
+            setup=forecast._FIT_CACHE.clear,
+        )
+
+    day_places = store.city(city).nlargest(ITINERARY_PLACES, 'monthly_visitors')
+    results['itinerary.plan'] = timeit(lambda: plan_itinerary(day_places, 3), repeat)
+    trip_places = store.cities_frame(store.cities[:3])
+    # A fixed number of search rounds rather than the wall-clock budget,
+    # which the solver would always use up
+    results['itinerary.schedule'] = timeit(
+        lambda: schedule_trip(trip_places, 5, month=11, time_budget=60.0, rounds=SCHEDULE_ROUNDS), repeat
+    )
+
+    page = store.city(city).head(CARDS_PER_PAGE)
+    results['cards.render'] = timeit(lambda: create_place_grid(page), repeat)
+
+    results['recommend.build'] = timeit(lambda: Recommender(store), repeat)
+    recommender = Recommender(store, cache_size=0)
+    results['recommend.similar'] = timeit(lambda: recommender.similar(0, k=24), repeat)
+    results['recommend.rank'] = timeit(lambda: recommender.rank(categories, (), 11, 0.5, None, 24), repeat)
+
+    return {'rows': len(df), 'cities': len(store.cities), 'generate_seconds': generate_seconds, 'paths': results}
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(report, baseline, tolerance):
+    """Print per-path ratios against ``baseline``; returns the regressed paths."""
+    regressions = []
+    for size, result in report['sizes'].items():
+        old = baseline.get('sizes', {}).get(size)
+        if old is None:
+            continue
+        for path, timing in result['paths'].items():
+            before = old['paths'].get(path)
+            if before is None or before['median'] <= 0:
+                continue
+            ratio = timing['median'] / before['median']
+            flag = ''
+            if ratio > 1 + tolerance:
+                regressions.append(f"{size}:{path}")
+                flag = '  <-- slower'
+            print(f"{size:>9} {path:<22} {before['median'] * 1000:10.2f}ms -> {timing['median'] * 1000:10.2f}ms  x{ratio:.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help="Write the report to this JSON file")
+    parser.add_argument('--baseline', default=None, help="Earlier report to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Allowed slowdown against the baseline before failing (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    report = {
+        'commit': git_commit(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'repeat': args.repeat,
+        'sizes': {},
+    }
+    for rows in args.sizes:
+        report['sizes'][str(rows)] = bench_size(rows, args.repeat, args.seed)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"Slower than baseline: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Load time and memory of the CSV path versus the Arrow snapshot.
+
+Writes a synthetic catalog CSV with the place schema, ingests it, then
+loads it both ways in fresh interpreters. For each load it reports wall
+time, peak RSS (VmHWM), and on Linux the private/anonymous versus file-backed
+parts of resident memory. File-backed pages of a memory-mapped snapshot
+are shared between worker processes.
+
+Usage::
+
+    python benchmarks/ingest.py --rows 1000000
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+LOAD_SCRIPT = textwrap.dedent('''
+    import json, resource, sys, time
+    sys.path.insert(0, {root!r})
+    import pandas as pd
+    from tourism.ingest import load_snapshot
+    from tourism.store import PlaceStore
+
+    start = time.perf_counter()
+    df = {loader}
+    loaded = time.perf_counter() - start
+    PlaceStore(df)
+    stored = time.perf_counter() - start
+
+    memory = {{}}
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith(('VmHWM', 'RssAnon', 'RssFile')):
+                    key, value = line.split(':')
+                    memory[key] = int(value.split()[0]) * 1024
+    except OSError:
+        # ru_maxrss is a fallback only: on Linux it also counts the parent
+        # process's memory from before exec
+        memory['VmHWM'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+    print(json.dumps({{'load_seconds': loaded, 'store_seconds': stored, 'memory': memory}}))
+''')
+
+
+def measure(loader):
+    code = LOAD_SCRIPT.format(root=ROOT, loader=loader)
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    from tourism.ingest import ingest
+    from tourism.synthetic import write_csv
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--workdir', default=None, help="Keep generated files here instead of a temp dir")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = args.workdir or tmp
+        os.makedirs(workdir, exist_ok=True)
+        csv_path = os.path.join(workdir, 'places.csv')
+        snapshot_path = os.path.join(workdir, 'places.arrow')
+
+        rows = write_csv(csv_path, args.rows)
+        start = time.perf_counter()
+        stats = ingest([csv_path], snapshot_path)
+        ingest_seconds = time.perf_counter() - start
+
+        report = {
+            'rows': rows,
+            'ingest_seconds': ingest_seconds,
+            'dropped': stats['dropped'],
+            'sizes': {
+                'csv': os.path.getsize(csv_path),
+                'parquet': os.path.getsize(stats['parquet']),
+                'arrow': os.path.getsize(snapshot_path),
+            },
+            'before_csv': measure(f"pd.read_csv({csv_path!r})"),
+            'after_snapshot': measure(f"load_snapshot({snapshot_path!r})"),
+        }
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
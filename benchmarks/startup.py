@@ -0,0 +1,109 @@
+"""Cold-start and per-rerun benchmark for the Streamlit app.
+
+Runs every page headlessly through Streamlit's AppTest harness, each in a
+fresh interpreter, and reports:
+
+* import time of the heavy dependencies and of every page module,
+* cold start: first full script run of a page in a new process,
+* rerun: median wall time of further reruns in the same process.
+
+Usage::
+
+    python benchmarks/startup.py --reruns 5 --budget 3.0
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import textwrap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ['numpy', 'pandas', 'streamlit', 'plotly.express', 'plotly.graph_objects', 'geopy.distance']
+
+PAGE_SCRIPT = textwrap.dedent('''
+    import json, sys, time
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file({app!r}, default_timeout=120)
+    at.run()
+    at.sidebar.radio[0].set_value({page!r}).run()
+    cold = time.perf_counter() - start
+    reruns = []
+    for _ in range({reruns}):
+        t = time.perf_counter()
+        at.run()
+        reruns.append(time.perf_counter() - t)
+    errors = [e.message for e in at.exception]
+    print(json.dumps({{"cold_start": cold, "reruns": reruns, "errors": errors}}))
+''')
+
+
+def _run(code):
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def import_time(module):
+    """Seconds to import ``module`` in a fresh interpreter."""
+    code = (
+        'import json, time, sys; sys.path.insert(0, ".");'
+        f't = time.perf_counter(); import {module};'
+        'print(json.dumps(time.perf_counter() - t))'
+    )
+    return _run(code)
+
+
+def page_timings(page, reruns):
+    code = PAGE_SCRIPT.format(app=os.path.join(ROOT, 'app.py'), page=page, reruns=reruns)
+    return _run(code)
+
+
+def main(argv=None):
+    sys.path.insert(0, ROOT)
+    from views import PAGE_MODULES
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--reruns', type=int, default=5)
+    parser.add_argument('--budget', type=float, default=None,
+                        help="Fail if any page's cold start exceeds this many seconds")
+    parser.add_argument('--output', default=None, help="Also write the report to this JSON file")
+    args = parser.parse_args(argv)
+
+    report = {
+        'python': sys.version.split()[0],
+        'imports': {module: import_time(module) for module in HEAVY_MODULES + list(PAGE_MODULES.values())},
+        'pages': {},
+    }
+    for page in PAGE_MODULES:
+        timings = page_timings(page, args.reruns)
+        report['pages'][page] = {
+            'cold_start': timings['cold_start'],
+            'rerun_median': statistics.median(timings['reruns']) if timings['reruns'] else None,
+            'errors': timings['errors'],
+        }
+
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+
+    if args.budget is not None:
+        over = [page for page, t in report['pages'].items() if t['cold_start'] > args.budget]
+        if over:
+            print(f"Cold start over {args.budget:.2f}s budget: {', '.join(over)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
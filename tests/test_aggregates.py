@@ -0,0 +1,49 @@
+import os
+
+import pandas as pd
+import pytest
+
+from tourism.aggregates import AggregateCube
+from tourism.ingest import load_places
+
+PLACES_CSV = os.path.join(os.path.dirname(__file__), '..', 'data', 'top_indian_places.csv')
+
+
+@pytest.fixture(scope='module')
+def places(tmp_path_factory):
+    return load_places(PLACES_CSV, str(tmp_path_factory.mktemp('data') / 'missing.arrow'))
+
+
+def _assert_same(cube, expected):
+    for name in ('city_totals', 'by_category', 'by_type', 'weather'):
+        got, want = getattr(cube, name), getattr(expected, name)
+        # Newer pandas infers a string index when refresh concatenates weather rows
+        pd.testing.assert_frame_equal(got.sort_index(), want.sort_index(), check_like=True, check_index_type=False)
+
+
+def _duplicate(df, rows):
+    return pd.concat([df, df.iloc[rows]], ignore_index=True)
+
+
+@pytest.mark.parametrize('edit', [
+    # One of two equal rows removed
+    lambda df: df.drop(index=0).reset_index(drop=True),
+    # A third copy of an already duplicated row
+    lambda df: _duplicate(df, [0]),
+    # An unrelated row changes while duplicates stay
+    lambda df: df.assign(monthly_visitors=df['monthly_visitors'].where(df.index != 5, 1)),
+    # A duplicated row moved to another city
+    lambda df: _duplicate(df, [1, 1]).assign(
+        city=lambda d: d['city'].where(d.index != len(d) - 1, df['city'].iloc[-1])),
+], ids=['drop-one-duplicate', 'add-duplicate', 'edit-row', 'move-duplicate'])
+def test_refresh_matches_rebuild(places, edit):
+    before = _duplicate(places, [0, 2, 2])
+    after = edit(before)
+    cube = AggregateCube(before).refresh(after)
+    _assert_same(cube, AggregateCube(after))
+    assert cube.version == AggregateCube(after).version
+
+
+def test_refresh_without_changes_is_a_no_op(places):
+    cube = AggregateCube(places)
+    assert cube.refresh(places.copy()) is cube
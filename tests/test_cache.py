@@ -0,0 +1,71 @@
+from tourism.cache import LRUCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = LRUCache(ttl=10, clock=clock)
+    cache.put('a', 1)
+    clock.now = 9.9
+    assert cache.get('a') == 1
+    clock.now = 10.0
+    assert cache.get('a') is None
+    assert len(cache) == 0
+    assert cache.stats()['expirations'] == 1
+
+
+def test_put_restarts_ttl():
+    clock = FakeClock()
+    cache = LRUCache(ttl=10, clock=clock)
+    cache.put('a', 1)
+    clock.now = 8
+    cache.put('a', 2)
+    clock.now = 15
+    assert cache.get('a') == 2
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = LRUCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+    assert cache.stats()['evictions'] == 1
+
+
+def test_byte_limit_evicts_until_under_budget():
+    cache = LRUCache(maxsize=10, max_bytes=10, sizeof=len)
+    cache.put('a', 'xxxx')
+    cache.put('b', 'xxxx')
+    cache.put('c', 'xxxxxx')
+    assert cache.get('a') is None
+    assert cache.bytes == 10
+    cache.put('b', 'x')
+    assert cache.bytes == 7
+
+
+def test_value_over_byte_limit_is_not_stored():
+    cache = LRUCache(max_bytes=4, sizeof=len)
+    cache.put('a', 'xx')
+    assert cache.get_or_compute('b', lambda: 'xxxxx') == 'xxxxx'
+    assert cache.get('b') is None
+    assert cache.get('a') == 'xx'
+
+
+def test_version_change_clears_entries():
+    cache = LRUCache()
+    cache.check_version('v1')
+    cache.put('a', 1)
+    cache.check_version('v1')
+    assert cache.get('a') == 1
+    cache.check_version('v2')
+    assert len(cache) == 0 and cache.bytes == 0
@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from tourism.distance import (
+    HAVERSINE_TOLERANCE,
+    distance_matrix,
+    distances_from,
+    haversine,
+    max_relative_error,
+)
+
+pytest.importorskip('geopy')
+
+PLACES_CSV = os.path.join(os.path.dirname(__file__), '..', 'data', 'top_indian_places.csv')
+
+
+@pytest.fixture(scope='module')
+def coords():
+    df = pd.read_csv(PLACES_CSV)
+    return df['latitude'].to_numpy(), df['longitude'].to_numpy()
+
+
+def test_matrix_within_tolerance_of_geopy(coords):
+    lats, lons = coords
+    assert max_relative_error(lats, lons) <= HAVERSINE_TOLERANCE
+
+
+def test_distances_from_within_tolerance_of_geopy(coords):
+    lats, lons = coords
+    approx = distances_from(lats[0], lons[0], lats, lons)
+    exact = distances_from(lats[0], lons[0], lats, lons, exact=True)
+    nonzero = exact > 0
+    assert np.all(np.abs(approx[nonzero] - exact[nonzero]) <= HAVERSINE_TOLERANCE * exact[nonzero])
+
+
+def test_matrix_is_symmetric_with_zero_diagonal(coords):
+    matrix = distance_matrix(*coords)
+    assert np.allclose(matrix, matrix.T)
+    assert np.allclose(np.diag(matrix), 0.0)
+
+
+def test_haversine_broadcasts():
+    # Delhi to Mumbai is about 1,150 km
+    distance = haversine(28.6139, 77.2090, [19.0760, 28.6139], [72.8777, 77.2090])
+    assert distance.shape == (2,)
+    assert 1100 < distance[0] < 1200
+    assert distance[1] == 0.0
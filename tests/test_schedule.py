@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from tourism.distance import places_distance_matrix
+from tourism.matrices import travel_minutes
+from tourism.schedule import day_windows, opening_windows, schedule_trip, visit_durations
+from tourism.store import PlaceStore
+from tourism.synthetic import generate_places
+
+EPS = 1e-6
+
+
+@pytest.fixture(scope='module')
+def places():
+    store = PlaceStore(generate_places(2, 300, seed=3))
+    return store.cities_frame(store.cities)
+
+
+def assert_feasible(places, schedule, day_hours, day_start, visit_minutes=None):
+    opens, closes = opening_windows(places)
+    duration = visit_durations(places, visit_minutes)
+    position = {name: i for i, name in enumerate(places['place_name'])}
+    seen = set()
+    for (day_start_minutes, day_end_minutes), route in zip(day_windows(day_hours, day_start), schedule):
+        stops = route.places
+        if not len(stops):
+            continue
+        assert stops['city'].nunique() == 1
+        rows = np.array([position[name] for name in stops['place_name']])
+        assert not seen & set(rows)
+        seen.update(rows)
+
+        arrival, start, end = (stops[c].to_numpy() for c in ('arrival', 'start', 'end'))
+        np.testing.assert_allclose(end - start, duration[rows])
+        assert np.all(start >= arrival - EPS)
+        assert np.all(start >= opens[rows] - EPS) and np.all(end <= closes[rows] + EPS)
+        assert arrival[0] >= day_start_minutes - EPS and end[-1] <= day_end_minutes + EPS
+
+        legs = travel_minutes(places_distance_matrix(stops))
+        travel = np.diag(legs, 1)
+        np.testing.assert_allclose(stops['travel_minutes'].to_numpy()[1:], travel, atol=1e-3)
+        np.testing.assert_allclose(arrival[1:], end[:-1] + travel, atol=1e-3)
+        # Waiting only for a place to open
+        waited = start > arrival + EPS
+        np.testing.assert_allclose(start[waited], opens[rows][waited])
+
+
+@pytest.mark.parametrize('time_budget', [0.0, 0.2])
+def test_every_day_is_feasible(places, time_budget):
+    day_hours = [8, 10, 6, 12]
+    schedule = schedule_trip(places, day_hours, month=11, day_start=8, time_budget=time_budget)
+    assert len(schedule) == len(day_hours)
+    assert_feasible(places, schedule, day_hours, 8)
+
+
+def test_short_visits_fill_long_days(places):
+    schedule = schedule_trip(places, [14] * 3, visit_minutes=20, day_start=7, time_budget=0.1)
+    assert_feasible(places, schedule, [14] * 3, 7, visit_minutes=20)
+
+
+def test_spent_budget_still_fills_every_day(places):
+    # The first greedy pass runs to completion whatever the budget
+    schedule = schedule_trip(places, 3, time_budget=0.0)
+    assert all(len(route.places) for route in schedule)
@@ -0,0 +1,36 @@
+import os
+
+import pandas as pd
+
+from tourism.ingest import load_places
+from tourism.store import PlaceStore
+
+PLACES_CSV = os.path.join(os.path.dirname(__file__), '..', 'data', 'top_indian_places.csv')
+
+
+def _write(tmp_path, edit):
+    df = pd.read_csv(PLACES_CSV, dtype=str)
+    edit(df)
+    path = tmp_path / 'places.csv'
+    df.to_csv(path, index=False)
+    return load_places(str(path), str(tmp_path / 'missing.arrow'))
+
+
+def test_blank_city_row_is_dropped(tmp_path):
+    def edit(df):
+        df.loc[0, 'city'] = None
+        df.loc[1, 'city'] = ''
+        df.loc[2, 'place_name'] = None
+    store = PlaceStore(_write(tmp_path, edit))
+    assert len(store) == len(pd.read_csv(PLACES_CSV)) - 3
+    assert all(isinstance(city, str) and city for city in store.cities)
+    assert list(store.df['city'].cat.categories) == store.cities
+
+
+def test_blank_integer_cells_are_dropped(tmp_path):
+    def edit(df):
+        df.loc[3, 'monthly_visitors'] = None
+        df.loc[4, 'historical_rainfall'] = 'n/a'
+    store = PlaceStore(_write(tmp_path, edit))
+    assert len(store) == len(pd.read_csv(PLACES_CSV)) - 2
+    assert store.df['monthly_visitors'].dtype == 'int32'
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from tourism.distance import haversine
+from tourism.spatial import SpatialIndex
+
+
+def _points(rng, n, lat_range, lon_ranges):
+    lats = rng.uniform(*lat_range, n)
+    lons = np.concatenate([rng.uniform(lo, hi, n // len(lon_ranges)) for lo, hi in lon_ranges])
+    return lats[:len(lons)], lons
+
+
+@pytest.fixture(scope='module', params=['india', 'antimeridian'])
+def points(request):
+    rng = np.random.default_rng(0)
+    if request.param == 'india':
+        lats, lons = _points(rng, 600, (8, 35), [(68, 97)])
+        queries = [(rng.uniform(8, 35), rng.uniform(68, 97)) for _ in range(100)]
+    else:
+        # Points on both sides of the 180 degree meridian
+        lats, lons = _points(rng, 600, (-20, -10), [(176, 180), (-180, -176)])
+        queries = [(rng.uniform(-20, -10), rng.choice([rng.uniform(178, 180), rng.uniform(-180, -178)])) for _ in range(100)]
+    return lats, lons, queries
+
+
+def test_nearest_matches_brute_force(points):
+    lats, lons, queries = points
+    index = SpatialIndex(lats, lons)
+    for k, (lat, lon) in enumerate(queries, start=1):
+        k = k % 25 + 1
+        positions, distances = index.nearest(lat, lon, k)
+        expected = np.sort(haversine(lat, lon, lats, lons))[:k]
+        assert np.allclose(distances, expected)
+        assert np.allclose(haversine(lat, lon, lats[positions], lons[positions]), distances)
+
+
+def test_within_matches_brute_force(points):
+    lats, lons, queries = points
+    index = SpatialIndex(lats, lons)
+    for i, (lat, lon) in enumerate(queries):
+        radius = 10 + 40 * (i % 10)
+        positions, distances = index.within(lat, lon, radius)
+        brute = haversine(lat, lon, lats, lons)
+        assert set(positions) == set(np.flatnonzero(brute <= radius))
+        assert np.all(np.diff(distances) >= 0)
+
+
+def test_nearest_respects_radius_cap():
+    rng = np.random.default_rng(1)
+    lats, lons = _points(rng, 300, (10, 30), [(70, 90)])
+    positions, distances = SpatialIndex(lats, lons).nearest(20, 80, 50, radius_km=100)
+    brute = haversine(20, 80, lats, lons)
+    assert len(positions) == min(50, int((brute <= 100).sum()))
+    assert np.all(distances <= 100)
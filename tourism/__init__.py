@@ -0,0 +1,5 @@
+"""Core data and compute helpers for the Tourist Place Recommender."""
+
+from tourism.store import PlaceStore
+
+__all__ = ["PlaceStore"]
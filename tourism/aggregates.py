@@ -0,0 +1,103 @@
+import pandas as pd
+
+from tourism.schema import temperature_columns
+from tourism.store import fingerprint, row_hashes
+
+# Columns kept per row so changed rows can be subtracted back out
+_ROW_COLUMNS = ['city', 'category', 'type', 'monthly_visitors']
+_WEATHER_COLUMNS = ['historical_rainfall', 'temperature_trend', 'best_time_to_visit']
+
+
+def _group_totals(rows, keys):
+    grouped = rows.groupby(keys, observed=True, sort=False)['monthly_visitors']
+    return pd.DataFrame({'visitors': grouped.sum(), 'places': grouped.size()})
+
+
+def _weather(df, cities=None):
+    if cities is not None:
+        df = df[df['city'].isin(cities)]
+    columns = _WEATHER_COLUMNS + [column for column in ('temp_min', 'temp_max') if column in df]
+    weather = df.groupby('city', observed=True, sort=False)[columns].first()
+    if 'temp_min' not in weather or 'temp_max' not in weather:
+        weather['temp_min'], weather['temp_max'] = temperature_columns(weather['temperature_trend'])
+    weather.index = weather.index.astype(object)
+    return weather
+
+
+def _occurrences(rows):
+    # (hash, n-th occurrence of that hash) for every row
+    hashes = rows['_hash']
+    return pd.MultiIndex.from_arrays([hashes.to_numpy(), hashes.groupby(hashes, sort=False).cumcount().to_numpy()])
+
+
+class AggregateCube:
+    """Per-city totals, category/type breakdowns and weather stats.
+
+    Built once per data version. :meth:`refresh` applies only the rows that
+    changed between two versions: visitor sums and place counts are
+    additive, and weather is re-read only for the cities that were touched.
+    Duplicate rows count once each.
+    """
+
+    def __init__(self, df):
+        self._rows = self._row_frame(df)
+        self.version = fingerprint(self._rows['_hash'].to_numpy())
+        self.city_totals = _group_totals(self._rows, 'city')
+        self.by_category = _group_totals(self._rows, ['city', 'category'])
+        self.by_type = _group_totals(self._rows, ['city', 'type'])
+        self.weather = _weather(df)
+
+    @staticmethod
+    def _row_frame(df):
+        # Visitors are stored as int32 but totals can exceed that
+        rows = df[_ROW_COLUMNS].astype({'city': object, 'category': object, 'type': object, 'monthly_visitors': 'int64'})
+        return rows.assign(_hash=row_hashes(df))
+
+    def _apply(self, rows, sign):
+        for name, keys in (('city_totals', 'city'), ('by_category', ['city', 'category']), ('by_type', ['city', 'type'])):
+            delta = _group_totals(rows, keys) * sign
+            table = getattr(self, name).add(delta, fill_value=0).astype('int64')
+            setattr(self, name, table[table['places'] > 0])
+
+    def refresh(self, df):
+        """Bring the cube up to date with ``df``, touching only changed rows."""
+        new_rows = self._row_frame(df)
+        version = fingerprint(new_rows['_hash'].to_numpy())
+        if version == self.version:
+            return self
+        # Rows are a multiset: pair up equal rows by occurrence so removing
+        # one of two duplicates is seen as a removal
+        old_keys, new_keys = _occurrences(self._rows), _occurrences(new_rows)
+        removed = self._rows[~old_keys.isin(new_keys)]
+        added = new_rows[~new_keys.isin(old_keys)]
+
+        self._apply(removed, -1)
+        self._apply(added, 1)
+        touched = pd.unique(pd.concat([removed['city'], added['city']]))
+        if len(touched):
+            kept = self.weather.drop(index=touched, errors='ignore')
+            self.weather = pd.concat([kept, _weather(df, touched)])
+
+        self._rows = new_rows
+        self.version = version
+        return self
+
+    def totals(self, cities):
+        """Visitor totals and place counts for ``cities``, in the order given."""
+        return self.city_totals.reindex(list(cities))
+
+    def categories(self, cities):
+        """Long-format (city, category, visitors, places) rows for ``cities``."""
+        return self._breakdown(self.by_category, cities)
+
+    def types(self, cities):
+        return self._breakdown(self.by_type, cities)
+
+    def _breakdown(self, table, cities):
+        cities = list(cities)
+        rows = table[table.index.get_level_values('city').isin(cities)].reset_index()
+        order = {city: i for i, city in enumerate(cities)}
+        return rows.sort_values('city', key=lambda s: s.map(order), kind='stable').reset_index(drop=True)
+
+    def weather_for(self, cities):
+        return self.weather.reindex(list(cities))
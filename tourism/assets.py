@@ -0,0 +1,219 @@
+import base64
+import hashlib
+import io
+import os
+import re
+import tempfile
+from functools import lru_cache
+
+ASSETS_DIR = 'assets'
+DEFAULT_PLACE_IMAGE = os.path.join(ASSETS_DIR, 'default_place.jpg')
+
+# Thumbnails are written under static/ so Streamlit can serve them directly
+# (server.enableStaticServing) at app/static/...
+STATIC_DIR = 'static'
+CACHE_SUBDIR = 'cache'
+STATIC_URL_PREFIX = 'app/static'
+
+# Stylesheets and scripts bundled, minified and content-hashed at startup.
+# The official Font Awesome release, when dropped into static/vendor/, is
+# served as-is (its CSS loads ../webfonts relatively); otherwise the local
+# icon subset is bundled in.
+STYLESHEETS = [os.path.join(STATIC_DIR, 'style.css')]
+SCRIPTS = [os.path.join(STATIC_DIR, 'script.js')]
+FONT_AWESOME_CSS = os.path.join(STATIC_DIR, 'vendor', 'fontawesome', 'css', 'all.min.css')
+ICON_SUBSET_CSS = os.path.join(STATIC_DIR, 'vendor', 'icons.css')
+
+THUMBNAIL_SIZE = (480, 320)
+MEMORY_CACHE_ENTRIES = 256
+DISK_CACHE_ENTRIES = 2048
+
+
+def place_image_path(place_name):
+    """Image for a place under assets/, falling back to the default image."""
+    image_path = os.path.join(ASSETS_DIR, f"{place_name.lower().replace(' ', '_')}.jpg")
+    if not os.path.exists(image_path):
+        image_path = DEFAULT_PLACE_IMAGE
+    return image_path
+
+
+def _cache_key(path, size):
+    stat = os.stat(path)
+    raw = f"{os.path.abspath(path)}:{stat.st_mtime_ns}:{stat.st_size}:{size}"
+    return hashlib.sha1(raw.encode()).hexdigest()[:16]
+
+
+def _resize(data, size):
+    # Pillow ships with Streamlit; anything it cannot decode is served as-is
+    try:
+        from PIL import Image
+        with Image.open(io.BytesIO(data)) as image:
+            image.thumbnail(size)
+            out = io.BytesIO()
+            image.convert('RGB').save(out, format='JPEG', quality=80, optimize=True)
+            return out.getvalue()
+    except Exception:
+        return data
+
+
+def _atime(path):
+    try:
+        return os.path.getatime(path)
+    except OSError:
+        return 0.0
+
+
+def _prune_disk_cache(cache_dir, max_entries=DISK_CACHE_ENTRIES):
+    # In-flight temp files belong to other writers and are left alone
+    entries = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if not name.endswith('.tmp')]
+    if len(entries) <= max_entries:
+        return
+    entries.sort(key=_atime)
+    for path in entries[:len(entries) - max_entries]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _write_atomic(path, data):
+    # A unique temp file per writer: sessions run as threads of one process,
+    # so several may build the same file at once; the last rename wins
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@lru_cache(maxsize=MEMORY_CACHE_ENTRIES)
+def _cached_file(path, size, key):
+    # ``key`` changes with the source file's mtime, so edits invalidate entries
+    cache_dir = os.path.join(STATIC_DIR, CACHE_SUBDIR)
+    os.makedirs(cache_dir, exist_ok=True)
+    ext = os.path.splitext(path)[1] if size is None else '.jpg'
+    cached_path = os.path.join(cache_dir, f"{key}{ext}")
+    if not os.path.exists(cached_path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        _write_atomic(cached_path, data if size is None else _resize(data, size))
+        _prune_disk_cache(cache_dir)
+    return cached_path
+
+
+def cached_asset_path(path, size=None):
+    """Path of the disk-cached copy of ``path``, resized when ``size`` is given."""
+    key = _cache_key(path, size)
+    cached_path = _cached_file(path, size, key)
+    if not os.path.exists(cached_path):
+        # Pruned from disk (or removed by hand) since it was memoized
+        _cached_file.cache_clear()
+        cached_path = _cached_file(path, size, key)
+    return cached_path
+
+
+def _static_url(cached_path):
+    relative = os.path.relpath(cached_path, STATIC_DIR).replace(os.sep, '/')
+    return f"{STATIC_URL_PREFIX}/{relative}"
+
+
+def thumbnail_url(path, size=THUMBNAIL_SIZE):
+    """Cacheable static URL of a thumbnail of ``path``."""
+    return _static_url(cached_asset_path(path, size))
+
+
+def asset_url(path):
+    """Cacheable static URL of ``path`` at its original size."""
+    return _static_url(cached_asset_path(path))
+
+
+def place_image_url(place_name, size=THUMBNAIL_SIZE):
+    return thumbnail_url(place_image_path(place_name), size)
+
+
+@lru_cache(maxsize=MEMORY_CACHE_ENTRIES)
+def _base64_of(path, key):
+    with open(path, 'rb') as f:
+        return base64.b64encode(f.read()).decode()
+
+
+def base64_of_file(path):
+    """Base64 of a file's bytes, memoized until the file changes."""
+    return _base64_of(path, _cache_key(path, None))
+
+
+# Quoted strings are kept verbatim; comments are dropped
+_CSS_SKIP = re.compile(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')|/\*.*?\*/", re.S)
+
+
+def _squeeze_css(css):
+    css = re.sub(r'\s+', ' ', css)
+    css = re.sub(r'\s*([{};,>])\s*', r'\1', css)
+    return re.sub(r':\s+', ':', css).replace(';}', '}')
+
+
+def minify_css(css):
+    """Strip comments and redundant whitespace outside of quoted strings."""
+    out, pos = [], 0
+    for match in _CSS_SKIP.finditer(css):
+        out.append(_squeeze_css(css[pos:match.start()]))
+        if match.group(1):
+            out.append(match.group(1))
+        pos = match.end()
+    out.append(_squeeze_css(css[pos:]))
+    return ''.join(out).strip()
+
+
+def minify_js(js):
+    """Conservative line-level minification: drops indentation, blank lines
+    and whole-line ``//`` comments, and keeps line breaks so automatic
+    semicolon insertion is unaffected."""
+    lines = (line.strip() for line in js.splitlines())
+    return '\n'.join(line for line in lines if line and not line.startswith('//'))
+
+
+@lru_cache(maxsize=16)
+def _bundle(paths, kind, key):
+    # ``key`` changes with the sources' mtimes, so edits produce a new bundle
+    parts = []
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            parts.append(f.read())
+    minify = minify_css if kind == 'css' else minify_js
+    content = minify('\n'.join(parts)).encode('utf-8')
+    digest = hashlib.sha1(content).hexdigest()[:12]
+
+    cache_dir = os.path.join(STATIC_DIR, CACHE_SUBDIR)
+    os.makedirs(cache_dir, exist_ok=True)
+    bundle_path = os.path.join(cache_dir, f"bundle.{digest}.{kind}")
+    if not os.path.exists(bundle_path):
+        _write_atomic(bundle_path, content)
+    return bundle_path
+
+
+def bundle_url(paths, kind):
+    """Static URL of the minified, content-hashed bundle of ``paths``."""
+    paths = tuple(paths)
+    key = tuple(_cache_key(path, None) for path in paths)
+    bundle_path = _bundle(paths, kind, key)
+    if not os.path.exists(bundle_path):
+        _bundle.cache_clear()
+        bundle_path = _bundle(paths, kind, key)
+    return _static_url(bundle_path)
+
+
+def stylesheet_urls():
+    """Stylesheet URLs for the page: icons first, then the app bundle."""
+    if os.path.exists(FONT_AWESOME_CSS):
+        return [_static_url(FONT_AWESOME_CSS), bundle_url(STYLESHEETS, 'css')]
+    return [bundle_url([ICON_SUBSET_CSS] + STYLESHEETS, 'css')]
+
+
+def script_url():
+    return bundle_url(SCRIPTS, 'js')
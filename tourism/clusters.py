@@ -0,0 +1,115 @@
+"""Grid clustering of places at several zoom levels.
+
+Each zoom level is a square grid whose cells are ``cell_km`` on a side,
+measured in equirectangular km. Longitude is scaled by the cosine of each
+place's latitude. Every place's cell label is computed for every level
+once per store. Per-city aggregates are built from those labels on first
+use and then cached, so a chart gets one marker per occupied cell. A
+marker carries the centroid, place count, visitor sum, dominant category
+and busiest place, whatever the city size.
+"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+from tourism.spatial import KM_PER_DEGREE
+
+# (name, cell edge in km), coarse to fine; 0 keeps every place separate
+ZOOM_LEVELS = [
+    ('Region', 50.0),
+    ('Metro', 20.0),
+    ('City', 10.0),
+    ('District', 5.0),
+    ('Neighbourhood', 2.0),
+    ('Block', 0.5),
+    ('Places', 0.0),
+]
+
+# Most markers a chart is ever sent
+MAX_MARKERS = 500
+
+
+def grid_labels(lats, lons, cell_km):
+    """Dense cell labels for points on a ``cell_km`` grid (0 = one label per point)."""
+    if cell_km <= 0:
+        return np.arange(len(lats), dtype=np.int32)
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    y = np.floor(lats * KM_PER_DEGREE / cell_km).astype(np.int64)
+    x = np.floor(lons * KM_PER_DEGREE * np.cos(np.radians(lats)) / cell_km).astype(np.int64)
+    keys = (y << 32) + (x & 0xFFFFFFFF)
+    return pd.factorize(keys)[0].astype(np.int32)
+
+
+class ClusterIndex:
+    """Per-level cell labels for a :class:`~tourism.store.PlaceStore`."""
+
+    def __init__(self, store, levels=ZOOM_LEVELS):
+        self.store = store
+        self.levels = list(levels)
+        df = store.df
+        lats, lons = df['latitude'].to_numpy(), df['longitude'].to_numpy()
+        self.labels = [grid_labels(lats, lons, cell_km) for _, cell_km in self.levels]
+        self._clusters = {}
+        self._lock = threading.Lock()
+
+    @property
+    def level_names(self):
+        return [name for name, _ in self.levels]
+
+    def clusters(self, city, level):
+        """One row per occupied cell of ``city`` at zoom ``level``, busiest first.
+
+        Columns: ``latitude``/``longitude`` (centroid), ``places``,
+        ``visitors``, ``category`` (most common) and ``top_place``.
+        """
+        key = (city, level)
+        with self._lock:
+            cached = self._clusters.get(key)
+        if cached is None:
+            cached = self._aggregate(self.store.city_slice(city), level)
+            with self._lock:
+                self._clusters[key] = cached
+        return cached
+
+    def _aggregate(self, rows, level):
+        df = self.store.df.iloc[rows]
+        labels = pd.factorize(self.labels[level][rows])[0]
+        n = labels.max() + 1 if len(labels) else 0
+        visitors = df['monthly_visitors'].to_numpy(dtype=np.int64)
+        counts = np.bincount(labels, minlength=n)
+
+        # Busiest place per cluster: first row after sorting by (cluster, -visitors)
+        order = np.lexsort((-visitors, labels))
+        first = order[np.searchsorted(labels[order], np.arange(n))]
+
+        category = df['category']
+        # Missing categories count towards the first one
+        codes = np.maximum(category.cat.codes.to_numpy().astype(np.int64), 0)
+        n_categories = len(category.cat.categories)
+        pair_counts = np.bincount(labels * n_categories + codes, minlength=n * n_categories)
+        dominant = pair_counts.reshape(n, n_categories).argmax(axis=1) if n else np.empty(0, dtype=np.int64)
+
+        clusters = pd.DataFrame({
+            'latitude': np.bincount(labels, df['latitude'].to_numpy(dtype=np.float64), n) / counts,
+            'longitude': np.bincount(labels, df['longitude'].to_numpy(dtype=np.float64), n) / counts,
+            'places': counts,
+            'visitors': np.bincount(labels, visitors, n).astype(np.int64),
+            'category': np.asarray(category.cat.categories, dtype=object)[dominant],
+            'top_place': df['place_name'].to_numpy(dtype=object)[first],
+        })
+        return clusters.sort_values('visitors', ascending=False, kind='stable').reset_index(drop=True)
+
+    def auto_level(self, city, max_markers=MAX_MARKERS):
+        """Finest zoom level whose marker count for ``city`` fits ``max_markers``."""
+        for level in range(len(self.levels) - 1, -1, -1):
+            if len(self.clusters(city, level)) <= max_markers:
+                return level
+        return 0
+
+    def markers(self, city, level=None, max_markers=MAX_MARKERS):
+        """Clusters for a chart, capped at ``max_markers`` (busiest kept)."""
+        if level is None:
+            level = self.auto_level(city, max_markers)
+        return self.clusters(city, level).head(max_markers)
@@ -0,0 +1,63 @@
+import numpy as np
+
+# Mean Earth radius (IUGG); haversine stays within ~0.6% of WGS-84 geodesics
+EARTH_RADIUS_KM = 6371.0088
+
+# Worst-case relative gap between the spherical and ellipsoidal models
+HAVERSINE_TOLERANCE = 0.006
+
+
+def haversine(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km; all arguments broadcast like NumPy arrays."""
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(a, dtype=np.float64)) for a in (lat1, lon1, lat2, lon2))
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+def _geodesic_matrix(lats1, lons1, lats2, lons2):
+    from geopy.distance import geodesic
+
+    out = np.empty((len(lats1), len(lats2)))
+    for i, point in enumerate(zip(lats1, lons1)):
+        for j, other in enumerate(zip(lats2, lons2)):
+            out[i, j] = geodesic(point, other).kilometers
+    return out
+
+
+def distances_from(lat, lon, lats, lons, exact=False):
+    """Distances in km from one point to many."""
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    if exact:
+        return _geodesic_matrix([lat], [lon], lats, lons)[0]
+    return haversine(lat, lon, lats, lons)
+
+
+def distance_matrix(lats, lons, exact=False):
+    """Full pairwise distance matrix in km for the given coordinates.
+
+    ``exact=True`` uses geopy's ellipsoidal geodesic pair by pair; it is
+    meant for validating the vectorized result, not for serving.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    if exact:
+        return _geodesic_matrix(lats, lons, lats, lons)
+    return haversine(lats[:, None], lons[:, None], lats[None, :], lons[None, :])
+
+
+def places_distance_matrix(places, exact=False):
+    """Pairwise distance matrix for a places frame, in row order."""
+    return distance_matrix(places['latitude'].to_numpy(), places['longitude'].to_numpy(), exact=exact)
+
+
+def max_relative_error(lats, lons):
+    """Largest relative gap between the haversine and geodesic matrices."""
+    approx = distance_matrix(lats, lons)
+    exact = distance_matrix(lats, lons, exact=True)
+    nonzero = exact > 0
+    if not nonzero.any():
+        return 0.0
+    return float(np.max(np.abs(approx[nonzero] - exact[nonzero]) / exact[nonzero]))
@@ -0,0 +1,150 @@
+import argparse
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from tourism.cache import LRUCache
+
+DEFAULT_MONTHS_AHEAD = 6
+
+# Fitted parameters keyed by (data hash, model name); shared across sessions
+_FIT_CACHE = LRUCache(maxsize=64)
+
+
+class LinearTrend:
+    """Ordinary least-squares trend ``a + b * t`` fitted per series."""
+
+    name = 'linear'
+
+    def fit(self, values, starts, lengths):
+        # Closed-form OLS for all series at once from segment sums
+        n = lengths.astype(np.float64)
+        t = np.arange(len(values)) - np.repeat(starts, lengths)
+        sum_y = np.add.reduceat(values, starts) if len(values) else np.zeros(0)
+        sum_ty = np.add.reduceat(values * t, starts) if len(values) else np.zeros(0)
+        sum_t = n * (n - 1) / 2
+        sum_tt = (n - 1) * n * (2 * n - 1) / 6
+        denom = n * sum_tt - sum_t ** 2
+        slope = np.divide(n * sum_ty - sum_t * sum_y, denom, out=np.zeros_like(n), where=denom > 0)
+        intercept = (sum_y - slope * sum_t) / n
+        return np.column_stack((intercept, slope, n))
+
+    def predict(self, params, months_ahead):
+        intercept, slope, n = params.T
+        steps = n[:, None] + np.arange(months_ahead)[None, :]
+        return intercept[:, None] + slope[:, None] * steps
+
+
+class SeasonalNaive:
+    """Repeats each series' last full season (or its last value if shorter)."""
+
+    name = 'seasonal_naive'
+
+    def __init__(self, season_length=12):
+        self.season_length = season_length
+
+    def fit(self, values, starts, lengths):
+        ends = starts + lengths
+        offsets = np.arange(self.season_length)[None, :]
+        seasonal = lengths >= self.season_length
+        # Index of each of the last season_length points, or of the last point
+        index = np.where(
+            seasonal[:, None],
+            ends[:, None] - self.season_length + offsets,
+            (ends - 1)[:, None] + 0 * offsets,
+        )
+        return values[index]
+
+    def predict(self, params, months_ahead):
+        return params[:, np.arange(months_ahead) % self.season_length]
+
+
+MODELS = {
+    LinearTrend.name: LinearTrend,
+    SeasonalNaive.name: SeasonalNaive,
+}
+
+
+def _data_hash(values, starts):
+    digest = hashlib.sha1(values.tobytes())
+    digest.update(starts.tobytes())
+    return digest.hexdigest()
+
+
+def fit_series(values, starts, model='linear'):
+    """Fit ``model`` to contiguous series ``values[starts[i]:starts[i + 1]]``.
+
+    Parameters are cached under a hash of the data, so refitting unchanged
+    data is a lookup.
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    starts = np.ascontiguousarray(starts, dtype=np.int64)
+    lengths = np.diff(np.append(starts, len(values)))
+    estimator = MODELS[model]()
+    key = (_data_hash(values, starts), model)
+    params = _FIT_CACHE.get_or_compute(key, lambda: estimator.fit(values, starts, lengths))
+    return estimator, params
+
+
+def predict_series(historical_data, months_ahead=DEFAULT_MONTHS_AHEAD, model='linear'):
+    """Forecast a single series, like fitting one model to ``historical_data``."""
+    estimator, params = fit_series(historical_data, [0], model)
+    return estimator.predict(params, months_ahead)[0]
+
+
+class Forecaster:
+    """Forecasts for every city (or every place) of a store from one batched fit."""
+
+    def __init__(self, store, model='linear', by='city'):
+        self.store = store
+        self.model = model
+        self.by = by
+        values = store.df['monthly_visitors'].to_numpy()
+        if by == 'city':
+            self.keys = [city for city in store.cities if len(store.city(city))]
+            starts = [store.city_slice(city).start for city in self.keys]
+        elif by == 'place':
+            self.keys = list(range(len(store)))
+            starts = self.keys
+        else:
+            raise ValueError(f"Unknown forecast grouping: {by}")
+        self._row = {key: i for i, key in enumerate(self.keys)}
+        self.estimator, self.params = fit_series(values, np.asarray(starts), model)
+
+    def predict(self, key, months_ahead=DEFAULT_MONTHS_AHEAD):
+        params = self.params[self._row[key]][None, :]
+        return self.estimator.predict(params, months_ahead)[0]
+
+    def predict_all(self, months_ahead=DEFAULT_MONTHS_AHEAD):
+        """Forecast table with one row per series and one column per month ahead."""
+        forecasts = self.estimator.predict(self.params, months_ahead)
+        columns = [f"month_{i + 1}" for i in range(months_ahead)]
+        frame = pd.DataFrame(forecasts, columns=columns)
+        labels = self.keys if self.by == 'city' else self.store.df['place_name'].to_numpy()
+        frame.insert(0, self.by, labels)
+        frame.insert(1, 'model', self.model)
+        return frame
+
+
+def main(argv=None):
+    from tourism.store import PlaceStore
+
+    parser = argparse.ArgumentParser(description="Precompute visitor forecasts for every city and place.")
+    parser.add_argument('--data', default='data/top_indian_places.csv')
+    parser.add_argument('--output', default='forecasts.csv')
+    parser.add_argument('--months-ahead', type=int, default=DEFAULT_MONTHS_AHEAD)
+    parser.add_argument('--models', nargs='+', default=list(MODELS), choices=list(MODELS))
+    args = parser.parse_args(argv)
+
+    store = PlaceStore(pd.read_csv(args.data))
+    frames = [
+        Forecaster(store, model, by).predict_all(args.months_ahead).rename(columns={by: 'key'}).assign(level=by)
+        for model in args.models
+        for by in ('city', 'place')
+    ]
+    pd.concat(frames, ignore_index=True).to_csv(args.output, index=False)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+"""Chunked CSV ingest into columnar snapshots.
+
+Each source CSV is streamed in chunks. Every chunk is validated and
+normalized, then appended as a row group to a Parquet file. The Parquet
+file is then rewritten as an uncompressed Arrow IPC snapshot. In the
+snapshot, rows are grouped by city and strings are dictionary-encoded.
+:func:`load_snapshot` memory-maps that file, so numeric columns are
+shared page-cache pages across worker processes instead of private
+copies.
+
+Usage::
+
+    python -m tourism.ingest data/top_indian_places.csv --output data/places.arrow
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from tourism.schema import DERIVED_DTYPES, NUMERIC_DTYPES, apply_schema
+
+DEFAULT_CSV = os.path.join('data', 'top_indian_places.csv')
+DEFAULT_SNAPSHOT = os.path.join('data', 'places.arrow')
+DEFAULT_CHUNKSIZE = 200_000
+
+REQUIRED_COLUMNS = [
+    'place_name', 'city', 'category', 'monthly_visitors', 'latitude', 'longitude',
+    'type', 'best_time_to_visit', 'historical_rainfall', 'temperature_trend',
+]
+STRING_COLUMNS = ['place_name', 'city', 'category', 'type', 'best_time_to_visit', 'temperature_trend']
+NUMERIC_COLUMNS = ['monthly_visitors', 'latitude', 'longitude', 'historical_rainfall']
+# Low-cardinality strings stored dictionary-encoded (pandas categoricals)
+DICTIONARY_COLUMNS = ['city', 'category', 'type', 'best_time_to_visit', 'temperature_trend']
+
+
+def normalize_chunk(chunk):
+    """Validate and clean one chunk; returns ``(clean_chunk, dropped_rows)``."""
+    missing = [column for column in REQUIRED_COLUMNS if column not in chunk.columns]
+    if missing:
+        raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    chunk = chunk[REQUIRED_COLUMNS].copy()
+    for column in STRING_COLUMNS:
+        chunk[column] = chunk[column].astype('string').str.strip()
+    for column in NUMERIC_COLUMNS:
+        chunk[column] = pd.to_numeric(chunk[column], errors='coerce')
+
+    valid = (
+        chunk['place_name'].notna() & (chunk['place_name'] != '')
+        & chunk['city'].notna() & (chunk['city'] != '')
+        & chunk['latitude'].between(-90, 90)
+        & chunk['longitude'].between(-180, 180)
+        & (chunk['monthly_visitors'] >= 0)
+        & (chunk['historical_rainfall'] >= 0)
+        & (chunk['monthly_visitors'] <= np.iinfo(np.int32).max)
+        & (chunk['historical_rainfall'] <= np.iinfo(np.int32).max)
+    )
+    chunk = chunk[valid.fillna(False).to_numpy(dtype=bool)]
+    for column in STRING_COLUMNS:
+        chunk[column] = chunk[column].astype(object)
+    # Compact numeric dtypes and parsed weather/season columns; strings are
+    # dictionary-encoded later, once the whole table is known
+    chunk = apply_schema(chunk, categorical=False)
+    return chunk.reset_index(drop=True), int((~valid.fillna(False)).sum())
+
+
+def stream_chunks(sources, chunksize=DEFAULT_CHUNKSIZE):
+    """Yield normalized chunks from one or more CSV sources."""
+    for source in sources:
+        for chunk in pd.read_csv(source, chunksize=chunksize, dtype=str, keep_default_na=True):
+            yield normalize_chunk(chunk)
+
+
+def parquet_schema():
+    """Arrow schema of a normalized chunk, fixed up front so that a chunk of
+    all-null or all-dropped values cannot narrow it to ``null`` types."""
+    import pyarrow as pa
+
+    types = {column: pa.string() for column in STRING_COLUMNS}
+    types.update({column: pa.from_numpy_dtype(np.dtype(dtype)) for column, dtype in NUMERIC_DTYPES.items()})
+    fields = [pa.field(column, types[column]) for column in REQUIRED_COLUMNS]
+    fields += [pa.field(column, pa.from_numpy_dtype(np.dtype(dtype))) for column, dtype in DERIVED_DTYPES.items()]
+    return pa.schema(fields)
+
+
+def write_parquet(sources, path, chunksize=DEFAULT_CHUNKSIZE):
+    """Stream ``sources`` into a Parquet file, one row group per chunk."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = parquet_schema()
+    writer = None
+    stats = {'rows': 0, 'dropped': 0, 'chunks': 0}
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        for chunk, dropped in stream_chunks(sources, chunksize):
+            stats['dropped'] += dropped
+            if not len(chunk):
+                continue
+            table = pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(tmp_path, schema)
+            writer.write_table(table)
+            stats['rows'] += len(chunk)
+            stats['chunks'] += 1
+        if writer is None:
+            raise ValueError("No rows to ingest")
+        writer.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        if writer is not None:
+            writer.close()
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return stats
+
+
+def write_arrow_snapshot(parquet_path, path):
+    """Rewrite a Parquet file as a city-grouped, memory-mappable Arrow file."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    table = pq.read_table(parquet_path)
+    # Group rows by city, keeping cities in order of first appearance
+    city_codes = pc.dictionary_encode(table['city']).combine_chunks().indices
+    order = np.argsort(city_codes.to_numpy(zero_copy_only=False), kind='stable')
+    table = table.take(pa.array(order))
+    columns = [
+        pc.dictionary_encode(table[name]) if name in DICTIONARY_COLUMNS else table[name]
+        for name in table.column_names
+    ]
+    table = pa.table(columns, names=table.column_names).combine_chunks()
+
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with pa.OSFile(tmp_path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(tmp_path, path)
+
+
+def ingest(sources, output=DEFAULT_SNAPSHOT, chunksize=DEFAULT_CHUNKSIZE):
+    """Build ``output`` (Arrow IPC) and its Parquet sibling from CSV sources."""
+    parquet_path = os.path.splitext(output)[0] + '.parquet'
+    stats = write_parquet(sources, parquet_path, chunksize)
+    write_arrow_snapshot(parquet_path, output)
+    stats['parquet'] = parquet_path
+    stats['snapshot'] = output
+    return stats
+
+
+def load_snapshot(path=DEFAULT_SNAPSHOT):
+    """Load an Arrow snapshot through a memory map.
+
+    Numeric columns without nulls are handed to pandas zero-copy, so their
+    pages stay shared with the OS page cache (and other processes).
+    """
+    import pyarrow as pa
+
+    source = pa.memory_map(path, 'r')
+    table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def load_places(csv_path=DEFAULT_CSV, snapshot_path=DEFAULT_SNAPSHOT):
+    """Places table from the snapshot when it is present and current, else the CSV."""
+    if os.path.exists(snapshot_path) and (
+        not os.path.exists(csv_path) or os.path.getmtime(snapshot_path) >= os.path.getmtime(csv_path)
+    ):
+        try:
+            return load_snapshot(snapshot_path)
+        except ImportError:
+            pass
+    return pd.read_csv(csv_path)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ingest place CSVs into a columnar snapshot.")
+    parser.add_argument('sources', nargs='*', default=[DEFAULT_CSV])
+    parser.add_argument('--output', default=DEFAULT_SNAPSHOT)
+    parser.add_argument('--chunksize', type=int, default=DEFAULT_CHUNKSIZE)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = ingest(args.sources, args.output, args.chunksize)
+    print(
+        f"Ingested {stats['rows']:,} rows in {stats['chunks']} chunks "
+        f"({stats['dropped']:,} dropped) in {time.perf_counter() - start:.2f}s "
+        f"-> {stats['snapshot']}, {stats['parquet']}"
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
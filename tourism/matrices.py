@@ -0,0 +1,183 @@
+"""Per-city distance and travel-time matrices as memory-mapped ``.npy`` files.
+
+:func:`build_matrices` writes two float32 matrices for every city, in the
+city's row order: pairwise haversine distances in km and estimated
+travel minutes. A ``manifest.json`` records each city's content version,
+an order-sensitive hash of its rows. A rebuild rewrites only the cities
+whose rows changed and deletes files no longer referenced.
+
+:class:`MatrixStore` opens the files with ``mmap_mode='r'``. Loading is
+zero-copy, and every worker process on the host shares the same page
+cache pages.
+
+Usage::
+
+    python -m tourism.matrices --output data/matrices
+"""
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+
+import numpy as np
+
+from tourism.distance import places_distance_matrix
+from tourism.store import row_hashes
+
+DEFAULT_DIR = os.path.join('data', 'matrices')
+MANIFEST = 'manifest.json'
+
+# Travel time model: straight-line km stretched to road km at an average urban speed
+ROAD_FACTOR = 1.3
+AVERAGE_SPEED_KMH = 25.0
+
+# A float32 n x n matrix is 4 n^2 bytes: 5,000 places is ~100 MB per matrix
+MAX_MATRIX_PLACES = 5_000
+
+
+def city_version(places):
+    """Order-sensitive content hash of a city's rows; matrices follow row order."""
+    return hashlib.sha1(row_hashes(places).tobytes()).hexdigest()[:16]
+
+
+def travel_minutes(distance_km):
+    return (np.asarray(distance_km) * ROAD_FACTOR / AVERAGE_SPEED_KMH * 60).astype(np.float32)
+
+
+def _slug(city):
+    return re.sub(r'[^a-z0-9]+', '-', str(city).lower()).strip('-') or 'city'
+
+
+def _save(path, array):
+    tmp_path = f"{path}.{os.getpid()}.tmp.npy"
+    np.save(tmp_path, array)
+    os.replace(tmp_path, path)
+
+
+def read_manifest(directory=DEFAULT_DIR):
+    try:
+        with open(os.path.join(directory, MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'cities': {}}
+
+
+def build_matrices(store, directory=DEFAULT_DIR, max_places=MAX_MATRIX_PLACES):
+    """Write matrices for every city of ``store`` whose rows changed; returns stats."""
+    os.makedirs(directory, exist_ok=True)
+    manifest = read_manifest(directory)
+    old = manifest.get('cities', {})
+    cities = {}
+    stats = {'built': 0, 'unchanged': 0, 'skipped': 0, 'removed': 0}
+
+    for city in store.cities:
+        places = store.city(city)
+        if not len(places) or len(places) > max_places:
+            stats['skipped'] += 1
+            continue
+        version = city_version(places)
+        entry = old.get(city)
+        if entry and entry['version'] == version and all(
+            os.path.exists(os.path.join(directory, entry[kind])) for kind in ('distance', 'minutes')
+        ):
+            cities[city] = entry
+            stats['unchanged'] += 1
+            continue
+
+        distances = places_distance_matrix(places).astype(np.float32)
+        entry = {
+            'version': version,
+            'rows': len(places),
+            'distance': f"{_slug(city)}-{version}.dist.npy",
+            'minutes': f"{_slug(city)}-{version}.time.npy",
+        }
+        _save(os.path.join(directory, entry['distance']), distances)
+        _save(os.path.join(directory, entry['minutes']), travel_minutes(distances))
+        cities[city] = entry
+        stats['built'] += 1
+
+    manifest = {'data_version': store.version, 'built_at': time.time(), 'cities': cities}
+    tmp_path = os.path.join(directory, f"{MANIFEST}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, os.path.join(directory, MANIFEST))
+
+    # Files of removed cities and superseded versions
+    referenced = {entry[kind] for entry in cities.values() for kind in ('distance', 'minutes')}
+    for name in os.listdir(directory):
+        if name.endswith('.npy') and name not in referenced:
+            os.remove(os.path.join(directory, name))
+            stats['removed'] += 1
+    return stats
+
+
+class MatrixStore:
+    """Read-only access to built matrices, opened as shared memory maps."""
+
+    def __init__(self, directory=DEFAULT_DIR):
+        self.directory = directory
+        self.manifest = read_manifest(directory)
+        self._maps = {}
+        self._lock = threading.Lock()
+
+    def _open(self, city, kind, version):
+        entry = self.manifest['cities'].get(city)
+        if entry is None or (version is not None and entry['version'] != version):
+            return None
+        key = (city, kind)
+        with self._lock:
+            if key not in self._maps:
+                try:
+                    self._maps[key] = np.load(os.path.join(self.directory, entry[kind]), mmap_mode='r')
+                except OSError:
+                    return None
+            return self._maps[key]
+
+    def distances(self, city, version=None):
+        """Distance matrix (km) for ``city``, or None when absent or stale."""
+        return self._open(city, 'distance', version)
+
+    def minutes(self, city, version=None):
+        """Travel-time matrix (minutes) for ``city``, or None when absent or stale."""
+        return self._open(city, 'minutes', version)
+
+    def for_places(self, places):
+        """Distance matrix matching a single city's ``places`` frame row for row, if built."""
+        if not len(places):
+            return None
+        cities = places['city'].unique()
+        if len(cities) != 1:
+            return None
+        entry = self.manifest['cities'].get(cities[0])
+        if entry is None or entry['rows'] != len(places):
+            return None
+        return self.distances(cities[0], city_version(places))
+
+
+def main(argv=None):
+    from tourism.ingest import DEFAULT_CSV, DEFAULT_SNAPSHOT, load_places
+    from tourism.store import PlaceStore
+
+    parser = argparse.ArgumentParser(description="Build per-city distance and travel-time matrices.")
+    parser.add_argument('--output', default=DEFAULT_DIR)
+    parser.add_argument('--csv', default=DEFAULT_CSV)
+    parser.add_argument('--snapshot', default=DEFAULT_SNAPSHOT)
+    parser.add_argument('--max-places', type=int, default=MAX_MATRIX_PLACES,
+                        help="Skip cities with more places than this")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = build_matrices(PlaceStore(load_places(args.csv, args.snapshot)), args.output, args.max_places)
+    print(
+        f"Built {stats['built']} cities, {stats['unchanged']} unchanged, {stats['skipped']} skipped, "
+        f"{stats['removed']} stale files removed in {time.perf_counter() - start:.2f}s -> {args.output}"
+    )
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""Opt-in timing spans with per-page latency histograms.
+
+Set ``TOURISM_METRICS=1`` to enable. With it unset, :func:`timed` returns
+the wrapped function unchanged and :func:`span` does nothing, so the
+instrumented code paths cost nothing in production.
+
+Spans are recorded against the page set with :func:`set_page`. Streamlit
+runs each session's script in its own thread, so the current page is
+tracked per context. :func:`write_prometheus` dumps every histogram in
+the Prometheus text exposition format for a node-exporter style textfile
+collector.
+"""
+import contextvars
+import functools
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+ENABLED = os.environ.get('TOURISM_METRICS', '').lower() in ('1', 'true', 'yes', 'on')
+METRICS_FILE = os.environ.get('TOURISM_METRICS_FILE', os.path.join('metrics', 'tourism.prom'))
+
+# Upper bounds in seconds; the last bucket catches everything else
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, math.inf)
+
+_current_page = contextvars.ContextVar('tourism_page', default='-')
+_write_lock = threading.Lock()
+
+
+class Histogram:
+    """Per-bucket (non-cumulative) counts plus the sum and count of observations."""
+
+    def __init__(self, buckets=BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * len(buckets)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds):
+        for i, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+        self.sum += seconds
+        self.count += 1
+
+    def quantile(self, q):
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if count and seen >= target:
+                return bound
+        return math.nan
+
+
+class Registry:
+    """Thread-safe ``(page, span) -> Histogram`` table and named caches."""
+
+    def __init__(self):
+        self.histograms = {}
+        self.caches = {}
+        self._lock = threading.Lock()
+
+    def observe(self, page, name, seconds):
+        with self._lock:
+            histogram = self.histograms.get((page, name))
+            if histogram is None:
+                histogram = self.histograms[(page, name)] = Histogram()
+            histogram.observe(seconds)
+
+    def register_cache(self, name, cache):
+        """Export an :class:`~tourism.cache.LRUCache`'s counters alongside the spans."""
+        self.caches[name] = cache
+
+    def summary(self, page=None):
+        """Rows of count, mean and p50/p95 (ms) per span, for display."""
+        with self._lock:
+            items = sorted(self.histograms.items())
+            rows = []
+            for (span_page, name), h in items:
+                if page is not None and span_page != page:
+                    continue
+                rows.append({
+                    'page': span_page,
+                    'span': name,
+                    'count': h.count,
+                    'mean_ms': 1000 * h.sum / h.count,
+                    'p50_ms': 1000 * h.quantile(0.5),
+                    'p95_ms': 1000 * h.quantile(0.95),
+                })
+        return rows
+
+    def prometheus_text(self):
+        lines = [
+            '# HELP tourism_span_seconds Wall-clock time spent in instrumented spans.',
+            '# TYPE tourism_span_seconds histogram',
+        ]
+        with self._lock:
+            for (page, name), h in sorted(self.histograms.items()):
+                labels = f'page="{_escape(page)}",span="{_escape(name)}"'
+                cumulative = 0
+                for bound, count in zip(h.buckets, h.counts):
+                    cumulative += count
+                    le = '+Inf' if math.isinf(bound) else repr(bound)
+                    lines.append(f'tourism_span_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+                lines.append(f'tourism_span_seconds_sum{{{labels}}} {h.sum!r}')
+                lines.append(f'tourism_span_seconds_count{{{labels}}} {h.count}')
+            caches = sorted(self.caches.items())
+        for counter in ('hits', 'misses', 'evictions', 'expirations'):
+            lines.append(f'# TYPE tourism_cache_{counter}_total counter')
+            for name, cache in caches:
+                lines.append(f'tourism_cache_{counter}_total{{cache="{_escape(name)}"}} {getattr(cache, counter, 0)}')
+        lines.append('# TYPE tourism_cache_entries gauge')
+        for name, cache in caches:
+            lines.append(f'tourism_cache_entries{{cache="{_escape(name)}"}} {len(cache)}')
+        return '\n'.join(lines) + '\n'
+
+    def clear(self):
+        with self._lock:
+            self.histograms.clear()
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+REGISTRY = Registry()
+
+
+def set_page(page):
+    """Attribute spans recorded in this context to ``page``."""
+    _current_page.set(page)
+
+
+@contextmanager
+def span(name):
+    """Time the enclosed block as ``name`` under the current page."""
+    if not ENABLED:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        REGISTRY.observe(_current_page.get(), name, time.perf_counter() - start)
+
+
+def timed(name=None):
+    """Decorator form of :func:`span`; a no-op unless metrics are enabled."""
+    def decorator(func):
+        if not ENABLED:
+            return func
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                REGISTRY.observe(_current_page.get(), span_name, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def write_prometheus(path=METRICS_FILE):
+    """Atomically write every histogram to ``path`` in Prometheus text format."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    # Sessions rerun concurrently as threads of one process and would
+    # otherwise share the temp file
+    with _write_lock:
+        with open(tmp_path, 'w') as f:
+            f.write(REGISTRY.prometheus_text())
+        os.replace(tmp_path, path)
@@ -0,0 +1,199 @@
+"""Batch precompute of every city x day-count itinerary.
+
+Work is spread over a process pool. Each worker loads the places table
+once, and tasks carry only ``(city, days)``. Finished itineraries are
+appended to a JSONL journal as they complete, one flushed line each. A
+rerun skips every ``(city, days)`` already in the journal for the same
+data version and options, so an interrupted run resumes where it
+stopped. ``--parquet`` converts the finished journal to a flat table of
+stops for offline use.
+
+Usage::
+
+    python -m tourism.precompute --max-days 7 --workers 8 \\
+        --output itineraries.jsonl --parquet itineraries.parquet
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from tourism.ingest import DEFAULT_CSV, DEFAULT_SNAPSHOT, load_places
+from tourism.matrices import DEFAULT_DIR as DEFAULT_MATRICES, MatrixStore
+from tourism.routing import DEFAULT_TIME_BUDGET, plan_itinerary
+from tourism.schedule import schedule_trip
+from tourism.store import PlaceStore
+
+ROUTERS = {
+    'cluster': plan_itinerary,
+    # Crowd-aware with opening hours; default day length, no travel month
+    'schedule': schedule_trip,
+}
+
+DEFAULT_OUTPUT = 'itineraries.jsonl'
+
+_store = None
+_matrices = None
+
+
+def _init_worker(csv_path, snapshot_path, matrix_dir=DEFAULT_MATRICES):
+    global _store, _matrices
+    _store = PlaceStore(load_places(csv_path, snapshot_path))
+    # Memory maps: every worker shares the same page-cache pages
+    _matrices = MatrixStore(matrix_dir)
+
+
+def solve(city, days, router='cluster', time_budget=DEFAULT_TIME_BUDGET, seed=0, store=None, matrices=None):
+    """Plan one itinerary and return it as a journal record.
+
+    ``store`` and ``matrices`` default to the ones the worker loaded.
+    """
+    if store is None:
+        store = _store
+    if matrices is None:
+        matrices = _matrices
+    start = time.perf_counter()
+    places = store.city(city)
+    distances = matrices.for_places(places) if matrices is not None else None
+    routes = ROUTERS[router](places, days, time_budget=time_budget, seed=seed, distances=distances)
+    return {
+        'city': city,
+        'days': days,
+        'router': router,
+        'time_budget': time_budget,
+        'version': store.version,
+        'total_distance_km': round(sum(route.distance_km for route in routes), 3),
+        'routes': [
+            {
+                'day': day + 1,
+                'distance_km': round(route.distance_km, 3),
+                'places': route.places['place_name'].astype(object).tolist(),
+            }
+            for day, route in enumerate(routes)
+        ],
+        'seconds': round(time.perf_counter() - start, 4),
+    }
+
+
+def read_journal(path):
+    """Records already in ``path``; a torn final line from a killed run is cut off."""
+    if not os.path.exists(path):
+        return []
+    with open(path, 'rb+') as f:
+        data = f.read()
+        end = data.rfind(b'\n') + 1
+        if end < len(data):
+            f.truncate(end)
+    records = []
+    for line in data[:end].splitlines():
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue
+    return records
+
+
+def _done_key(record):
+    return record['city'], record['days'], record['router'], record['time_budget'], record['version']
+
+
+def write_parquet(records, path):
+    """Flatten records to one row per stop and write them as Parquet."""
+    import pandas as pd
+
+    rows = [
+        {
+            'city': record['city'],
+            'days': record['days'],
+            'router': record['router'],
+            'version': record['version'],
+            'day': route['day'],
+            'stop': stop + 1,
+            'place_name': place,
+            'day_distance_km': route['distance_km'],
+        }
+        for record in records
+        for route in record['routes']
+        for stop, place in enumerate(route['places'])
+    ]
+    pd.DataFrame(rows).to_parquet(path, index=False)
+
+
+def precompute(output=DEFAULT_OUTPUT, max_days=7, router='cluster', time_budget=DEFAULT_TIME_BUDGET,
+               workers=None, csv_path=DEFAULT_CSV, snapshot_path=DEFAULT_SNAPSHOT, progress=None,
+               matrix_dir=DEFAULT_MATRICES):
+    """Plan every missing (city, days) itinerary into ``output``; returns run stats."""
+    store = PlaceStore(load_places(csv_path, snapshot_path))
+    done = {_done_key(record) for record in read_journal(output)}
+    tasks = [
+        (city, days)
+        for city in store.cities
+        for days in range(1, max_days + 1)
+        if (city, days, router, time_budget, store.version) not in done
+    ]
+    total = len(store.cities) * max_days
+    stats = {'version': store.version, 'total': total, 'skipped': total - len(tasks), 'planned': 0}
+
+    start = time.perf_counter()
+    with open(output, 'a') as journal, ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(csv_path, snapshot_path, matrix_dir)
+    ) as pool:
+        futures = [pool.submit(solve, city, days, router, time_budget) for city, days in tasks]
+        try:
+            for future in as_completed(futures):
+                journal.write(json.dumps(future.result()) + '\n')
+                journal.flush()
+                stats['planned'] += 1
+                if progress:
+                    progress(stats, time.perf_counter() - start)
+        except KeyboardInterrupt:
+            for future in futures:
+                future.cancel()
+            raise
+    stats['seconds'] = time.perf_counter() - start
+    stats['per_second'] = stats['planned'] / stats['seconds'] if stats['seconds'] > 0 else 0.0
+    return stats
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Precompute itineraries for every city and day count.")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help="JSONL journal (appended to; enables resume)")
+    parser.add_argument('--parquet', default=None, help="Also write the finished journal as Parquet")
+    parser.add_argument('--max-days', type=int, default=7)
+    parser.add_argument('--router', choices=list(ROUTERS), default='cluster')
+    parser.add_argument('--time-budget', type=float, default=DEFAULT_TIME_BUDGET)
+    parser.add_argument('--workers', type=int, default=None, help="Pool size (default: CPU count)")
+    parser.add_argument('--csv', default=DEFAULT_CSV)
+    parser.add_argument('--snapshot', default=DEFAULT_SNAPSHOT)
+    parser.add_argument('--matrices', default=DEFAULT_MATRICES, help="Prebuilt distance matrices, used when current")
+    args = parser.parse_args(argv)
+
+    def progress(stats, elapsed):
+        if stats['planned'] % 100 == 0:
+            print(f"{stats['planned']:,} planned, {stats['planned'] / elapsed:.1f} itineraries/s", flush=True)
+
+    try:
+        stats = precompute(
+            args.output, args.max_days, args.router, args.time_budget,
+            args.workers, args.csv, args.snapshot, progress, args.matrices,
+        )
+    except KeyboardInterrupt:
+        print(f"Interrupted; rerun to resume from {args.output}", file=sys.stderr)
+        return 130
+    print(
+        f"Planned {stats['planned']:,} itineraries ({stats['skipped']:,} already done) "
+        f"in {stats['seconds']:.2f}s: {stats['per_second']:.1f} itineraries/s"
+    )
+    if args.parquet:
+        # Only the current run's data version and options, not older entries
+        current = (args.router, args.time_budget, stats['version'])
+        records = [record for record in read_journal(args.output) if _done_key(record)[2:] == current]
+        write_parquet(records, args.parquet)
+        print(f"Wrote {args.parquet}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,168 @@
+import numpy as np
+
+from tourism.cache import LRUCache
+from tourism.distance import EARTH_RADIUS_KM
+from tourism.metrics import timed
+
+# Relative weight of each feature block in the similarity score
+BLOCK_WEIGHTS = {
+    'category': 1.0,
+    'type': 0.8,
+    'season': 0.5,
+    'popularity': 0.5,
+    'location': 1.0,
+}
+
+# Location is embedded with random Fourier features, whose dot product
+# approximates a Gaussian kernel on distance with this length scale
+LOCATION_SCALE_KM = 50.0
+LOCATION_FEATURES = 32
+
+
+def _unit_rows(block):
+    norms = np.linalg.norm(block, axis=1, keepdims=True)
+    return np.divide(block, norms, out=np.zeros_like(block), where=norms > 0)
+
+
+def _one_hot(series):
+    codes = series.astype('category').cat.codes.to_numpy()
+    categories = list(series.astype('category').cat.categories)
+    block = np.zeros((len(series), len(categories)), dtype=np.float32)
+    # Missing values (code -1) keep an all-zero block
+    rows = np.flatnonzero(codes >= 0)
+    block[rows, codes[rows]] = 1.0
+    return block, categories
+
+
+def _location_features(lats, lons, seed=0):
+    km_per_degree = np.pi * EARTH_RADIUS_KM / 180
+    ref = np.radians(lats.mean()) if len(lats) else 0.0
+    xy = np.column_stack((lats * km_per_degree, lons * km_per_degree * np.cos(ref)))
+    rng = np.random.default_rng(seed)
+    weights = rng.normal(scale=1 / LOCATION_SCALE_KM, size=(2, LOCATION_FEATURES))
+    phases = rng.uniform(0, 2 * np.pi, LOCATION_FEATURES)
+    return np.sqrt(2 / LOCATION_FEATURES) * np.cos(xy @ weights + phases)
+
+
+class Recommender:
+    """Dense place feature matrix with cached top-k similarity queries.
+
+    Every place is encoded as weighted, L2-normalized blocks for category,
+    type, best-time months, popularity and location, so a single matrix
+    product gives cosine-style scores for all places at once.
+    """
+
+    def __init__(self, store, cache_size=512):
+        self.store = store
+        df = store.df
+
+        category, self.categories = _one_hot(df['category'])
+        place_type, self.types = _one_hot(df['type'])
+
+        masks = df['best_months'].to_numpy().astype(np.int64)
+        season = ((masks[:, None] >> np.arange(12)) & 1).astype(np.float32)
+
+        visitors = np.log1p(df['monthly_visitors'].to_numpy(dtype=np.float64))
+        span = visitors.max() - visitors.min() if len(visitors) else 0
+        popularity = ((visitors - visitors.min()) / span if span else np.ones_like(visitors))
+        popularity = popularity.astype(np.float32)[:, None]
+
+        location = _location_features(
+            df['latitude'].to_numpy(dtype=np.float64),
+            df['longitude'].to_numpy(dtype=np.float64),
+        )
+
+        blocks = {
+            'category': category,
+            'type': place_type,
+            'season': season,
+            'popularity': popularity,
+            'location': location.astype(np.float32),
+        }
+        self._offsets = {}
+        start = 0
+        for name, block in blocks.items():
+            self._offsets[name] = slice(start, start + block.shape[1])
+            start += block.shape[1]
+
+        matrix = np.hstack([
+            (_unit_rows(block) if name != 'popularity' else block) * BLOCK_WEIGHTS[name]
+            for name, block in blocks.items()
+        ]).astype(np.float32)
+        self.matrix = np.ascontiguousarray(_unit_rows(matrix))
+        self._cache = LRUCache(cache_size)
+
+    def _city_mask(self, cities):
+        if not cities:
+            return None
+        mask = np.zeros(len(self.store), dtype=bool)
+        for city in cities:
+            mask[self.store.city_slice(city)] = True
+        return mask
+
+    def _top_k(self, scores, k, mask=None, exclude=None):
+        scores = scores.copy()
+        if mask is not None:
+            scores[~mask] = -np.inf
+        if exclude is not None:
+            scores[exclude] = -np.inf
+        candidates = int(np.isfinite(scores).sum())
+        k = min(k, candidates)
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return top, scores[top]
+
+    def _frame(self, result):
+        positions, scores = result
+        return self.store.df.iloc[positions].assign(score=scores)
+
+    @timed('recommend.similar')
+    def similar(self, position, k=10, cities=None):
+        """The ``k`` places most like the place at row ``position``."""
+        key = ('similar', int(position), k, tuple(sorted(cities or ())))
+
+        def compute():
+            scores = self.matrix @ self.matrix[position]
+            return self._top_k(scores, k, self._city_mask(cities), exclude=position)
+
+        return self._frame(self._cache.get_or_compute(key, compute))
+
+    def query_vector(self, categories=(), types=(), month=None, popularity=0.0):
+        """Preference vector in the place feature space.
+
+        ``month`` is 1-12; ``popularity`` in [0, 1] favours busier places.
+        """
+        query = np.zeros(self.matrix.shape[1], dtype=np.float32)
+        for name, wanted, vocabulary in (
+            ('category', categories, self.categories),
+            ('type', types, self.types),
+        ):
+            hits = [vocabulary.index(value) for value in wanted if value in vocabulary]
+            if hits:
+                block = query[self._offsets[name]]
+                block[hits] = BLOCK_WEIGHTS[name] / np.sqrt(len(hits))
+        if month:
+            query[self._offsets['season'].start + month - 1] = BLOCK_WEIGHTS['season']
+        query[self._offsets['popularity']] = BLOCK_WEIGHTS['popularity'] * popularity
+        return query
+
+    @timed('recommend.rank')
+    def rank(self, categories=(), types=(), month=None, popularity=0.0, cities=None, k=20):
+        """Top ``k`` places for a set of preferences, optionally within some cities."""
+        key = (
+            'rank',
+            tuple(sorted(categories)),
+            tuple(sorted(types)),
+            month,
+            round(float(popularity), 3),
+            tuple(sorted(cities or ())),
+            k,
+        )
+
+        def compute():
+            query = self.query_vector(categories, types, month, popularity)
+            return self._top_k(self.matrix @ query, k, self._city_mask(cities))
+
+        return self._frame(self._cache.get_or_compute(key, compute))
@@ -0,0 +1,254 @@
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from tourism.cache import LRUCache
+from tourism.distance import places_distance_matrix
+from tourism.metrics import REGISTRY
+from tourism.store import data_version
+
+# Default wall-clock budget for improving all days of one itinerary
+DEFAULT_TIME_BUDGET = 0.5
+
+# Planned itineraries shared by every caller in the process
+ITINERARY_CACHE_SIZE = 256
+ITINERARY_TTL = 6 * 60 * 60
+ITINERARY_CACHE = LRUCache(maxsize=ITINERARY_CACHE_SIZE, ttl=ITINERARY_TTL)
+REGISTRY.register_cache('itinerary', ITINERARY_CACHE)
+
+_EPS = 1e-9
+
+
+@dataclass
+class DayRoute:
+    places: pd.DataFrame
+    distance_km: float
+
+
+def _planar_coords(places):
+    # Equirectangular projection so k-means distances are roughly isotropic
+    lats = places['latitude'].to_numpy(dtype=np.float64)
+    lons = places['longitude'].to_numpy(dtype=np.float64)
+    scale = np.cos(np.radians(lats.mean())) if len(lats) else 1.0
+    return np.column_stack((lats, lons * scale))
+
+
+def _kmeans(coords, k, rng, iterations=25):
+    # k-means++ seeding followed by Lloyd iterations
+    centroids = [coords[rng.integers(len(coords))]]
+    for _ in range(1, k):
+        d2 = np.min(((coords[:, None, :] - np.array(centroids)[None]) ** 2).sum(-1), axis=1)
+        total = d2.sum()
+        idx = rng.choice(len(coords), p=d2 / total) if total > 0 else rng.integers(len(coords))
+        centroids.append(coords[idx])
+    centroids = np.array(centroids)
+
+    for _ in range(iterations):
+        labels = ((coords[:, None, :] - centroids[None]) ** 2).sum(-1).argmin(axis=1)
+        updated = np.array([
+            coords[labels == c].mean(axis=0) if np.any(labels == c) else centroids[c]
+            for c in range(k)
+        ])
+        if np.allclose(updated, centroids):
+            break
+        centroids = updated
+    return centroids
+
+
+def _balanced_assign(coords, centroids, capacity):
+    # Greedy assignment by increasing distance, respecting a per-day cap
+    d2 = ((coords[:, None, :] - centroids[None]) ** 2).sum(-1)
+    labels = np.full(len(coords), -1)
+    load = np.zeros(len(centroids), dtype=int)
+    for flat in np.argsort(d2, axis=None, kind='stable'):
+        point, cluster = divmod(int(flat), len(centroids))
+        if labels[point] == -1 and load[cluster] < capacity:
+            labels[point] = cluster
+            load[cluster] += 1
+    return labels
+
+
+def split_days(places, num_days, seed=0):
+    """Split places into ``num_days`` geographically compact groups.
+
+    Returns a list of positional index arrays, balanced so that no day
+    holds more than ``ceil(n / num_days)`` places.
+    """
+    n = len(places)
+    k = max(1, min(num_days, n))
+    if n == 0:
+        return [np.empty(0, dtype=int) for _ in range(num_days)]
+
+    coords = _planar_coords(places)
+    centroids = _kmeans(coords, k, np.random.default_rng(seed))
+    labels = _balanced_assign(coords, centroids, -(-n // k))
+
+    # Order days west to east so consecutive days move across the city
+    order = np.argsort(centroids[:, 1], kind='stable')
+    groups = [np.flatnonzero(labels == c) for c in order]
+    groups.extend(np.empty(0, dtype=int) for _ in range(num_days - k))
+    return groups
+
+
+def path_length(path, dist):
+    if len(path) < 2:
+        return 0.0
+    return float(dist[path[:-1], path[1:]].sum())
+
+
+def nearest_neighbour_path(dist, start=0):
+    n = len(dist)
+    visited = np.zeros(n, dtype=bool)
+    path = [start]
+    visited[start] = True
+    for _ in range(n - 1):
+        row = np.where(visited, np.inf, dist[path[-1]])
+        nxt = int(row.argmin())
+        path.append(nxt)
+        visited[nxt] = True
+    return np.array(path, dtype=int)
+
+
+def two_opt(path, dist, deadline):
+    """Improve an open path with 2-opt segment reversals until no gain or deadline."""
+    path = path.copy()
+    m = len(path)
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        for i in range(m - 2):
+            a, b = path[i], path[i + 1]
+            cs = path[i + 2:]
+            es = np.append(path[i + 3:], -1)
+            has_next = es >= 0
+            delta = dist[a, cs] - dist[a, b]
+            delta[has_next] += dist[b, es[has_next]] - dist[cs[has_next], es[has_next]]
+            j = int(delta.argmin())
+            if delta[j] < -_EPS:
+                path[i + 1:i + 3 + j] = path[i + 1:i + 3 + j][::-1]
+                improved = True
+            if time.perf_counter() >= deadline:
+                break
+    return path
+
+
+def _best_insertion(rest, seg, dist):
+    # Cost of inserting seg (either direction) at every gap of rest, including both ends
+    first, last = seg[0], seg[-1]
+    best = (np.inf, 0, False)
+    for reverse, (head, tail) in ((False, (first, last)), (True, (last, first))):
+        inner = dist[rest[:-1], head] + dist[tail, rest[1:]] - dist[rest[:-1], rest[1:]]
+        costs = np.concatenate(([dist[tail, rest[0]]], inner, [dist[rest[-1], head]]))
+        t = int(costs.argmin())
+        if costs[t] < best[0]:
+            best = (float(costs[t]), t, reverse)
+    return best
+
+
+def or_opt(path, dist, deadline, max_segment=3):
+    """Relocate segments of up to ``max_segment`` places to cheaper positions."""
+    path = list(path)
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        for length in range(1, max_segment + 1):
+            s = 0
+            while s + length <= len(path) and len(path) - length >= 1:
+                seg = path[s:s + length]
+                prev = path[s - 1] if s > 0 else None
+                nxt = path[s + length] if s + length < len(path) else None
+                gain = 0.0
+                if prev is not None:
+                    gain += dist[prev, seg[0]]
+                if nxt is not None:
+                    gain += dist[seg[-1], nxt]
+                if prev is not None and nxt is not None:
+                    gain -= dist[prev, nxt]
+
+                rest = np.array(path[:s] + path[s + length:], dtype=int)
+                cost, t, reverse = _best_insertion(rest, seg, dist)
+                if cost < gain - _EPS:
+                    seg = seg[::-1] if reverse else seg
+                    rest = list(rest)
+                    path = rest[:t] + seg + rest[t:]
+                    improved = True
+                s += 1
+                if time.perf_counter() >= deadline:
+                    return np.array(path, dtype=int)
+    return np.array(path, dtype=int)
+
+
+def order_day(dist, deadline):
+    """Visit order for one day: nearest neighbour, then 2-opt and Or-opt."""
+    n = len(dist)
+    if n < 3:
+        return np.arange(n)
+    # Start from a place on the edge of the group rather than the middle
+    start = int(dist.sum(axis=1).argmax())
+    path = nearest_neighbour_path(dist, start)
+    best = path
+    best_length = path_length(path, dist)
+    while time.perf_counter() < deadline:
+        candidate = or_opt(two_opt(best, dist, deadline), dist, deadline)
+        candidate_length = path_length(candidate, dist)
+        if candidate_length >= best_length - _EPS:
+            break
+        best, best_length = candidate, candidate_length
+    return best
+
+
+def plan_itinerary(places, num_days, time_budget=DEFAULT_TIME_BUDGET, seed=0, distances=None):
+    """Split places into days by location and order each day's visits.
+
+    Returns one :class:`DayRoute` per day. Improvement stops once
+    ``time_budget`` seconds have passed, keeping the best route so far.
+    ``distances`` is an optional precomputed matrix for ``places`` in row
+    order (see :mod:`tourism.matrices`); each day reads its sub-matrix.
+    """
+    deadline = time.perf_counter() + time_budget
+    groups = split_days(places, num_days, seed=seed)
+    days = []
+    remaining = [g for g in groups if len(g)]
+    for group in groups:
+        if not len(group):
+            days.append(DayRoute(places.iloc[[]], 0.0))
+            continue
+        day_places = places.iloc[group]
+        if distances is not None:
+            dist = np.asarray(distances[np.ix_(group, group)], dtype=np.float64)
+        else:
+            dist = places_distance_matrix(day_places)
+        # Share what is left of the budget evenly across the remaining days
+        now = time.perf_counter()
+        day_deadline = now + max(0.0, deadline - now) / len(remaining)
+        remaining.pop()
+        order = order_day(dist, day_deadline)
+        days.append(DayRoute(day_places.iloc[order], path_length(order, dist)))
+    return days
+
+
+def itinerary_key(places, num_days, time_budget=DEFAULT_TIME_BUDGET, seed=0):
+    """Normalized cache key: the same set of places and options give the same key."""
+    return data_version(places), int(num_days), round(float(time_budget), 3), int(seed)
+
+
+def cached_itinerary(places, num_days, time_budget=DEFAULT_TIME_BUDGET, seed=0, version=None, distances=None,
+                     cache=ITINERARY_CACHE, plan=None):
+    """:func:`plan_itinerary` memoized in ``cache``.
+
+    Passing the table's data ``version`` clears the cache whenever it
+    changes, so plans built from old data are not kept around until they
+    expire. ``plan`` optionally replaces planning in this thread on a miss,
+    e.g. to run it on a worker pool; it takes no arguments and must return
+    what :func:`plan_itinerary` would. Nothing is cached if it raises.
+    Cached :class:`DayRoute` objects are shared; callers must not modify them.
+    """
+    if version is not None:
+        cache.check_version(version)
+    if plan is None:
+        def plan():
+            return plan_itinerary(places, num_days, time_budget, seed, distances)
+    key = itinerary_key(places, num_days, time_budget, seed)
+    return cache.get_or_compute(key, plan)
@@ -0,0 +1,453 @@
+"""Crowd-aware, time-budgeted multi-day trip scheduling.
+
+A trip is a run of days. Each day has a start hour and an hour budget.
+Every day is spent in one city. Days go to the trip's cities in the order
+given, each extra day to the city with the most value left to see.
+Within a city the scheduler picks which places to visit, on which day and
+at what time, to maximise
+
+    sum(value - crowding) - travel
+
+* A place's value grows with its popularity and is halved outside its
+  best season.
+* Crowding is popularity (damped off season) times a time-of-day profile
+  that peaks early in the afternoon.
+* Travel is the estimated road time between consecutive visits, in
+  minutes (see :func:`tourism.matrices.travel_minutes`).
+
+Every visit has to fit its opening hours, and every day its budget.
+
+Solving is anytime. Greedy insertion by best gain per minute of the day
+gives a first schedule, which is always completed. An iterated local
+search then runs until ``time_budget`` seconds have passed, keeping the
+best schedule found. Each
+round removes a run of visits from every day, re-inserts greedily and
+2-opts each day's order.
+"""
+import hashlib
+import time
+
+import numpy as np
+import pandas as pd
+
+from tourism.distance import places_distance_matrix
+from tourism.matrices import travel_minutes
+from tourism.metrics import timed
+from tourism.routing import DEFAULT_TIME_BUDGET, ITINERARY_CACHE, DayRoute
+from tourism.schema import month_mask_column, months_filter
+from tourism.store import row_hashes
+
+DEFAULT_DAY_START = 9.0
+DEFAULT_DAY_HOURS = 8.0
+
+# Minutes spent at a place, by category
+DEFAULT_VISIT_MINUTES = 90.0
+VISIT_MINUTES = {
+    'Historical': 90.0,
+    'Religious': 45.0,
+    'Scenic': 60.0,
+    'Nature': 120.0,
+    'Natural': 120.0,
+    'Museum': 120.0,
+    'Garden': 60.0,
+    'Educational': 90.0,
+    'Entertainment': 180.0,
+    'Shopping': 90.0,
+    'Modern': 60.0,
+    'Sports': 90.0,
+    'Art': 90.0,
+    'Recreation': 120.0,
+}
+
+# (opens, closes) in hours, by category; ``opens``/``closes`` columns override
+DEFAULT_OPENING_HOURS = (9.0, 18.0)
+OPENING_HOURS = {
+    'Religious': (6.0, 21.0),
+    'Scenic': (6.0, 19.0),
+    'Nature': (6.0, 18.0),
+    'Natural': (6.0, 18.0),
+    'Garden': (6.0, 19.0),
+    'Museum': (10.0, 17.0),
+    'Entertainment': (10.0, 20.0),
+    'Shopping': (10.0, 21.0),
+}
+
+# Relative crowd level at each hour of the day (0-23)
+HOURLY_CROWD = np.array([
+    0.1, 0.1, 0.1, 0.1, 0.1, 0.1, 0.15, 0.2, 0.3, 0.45, 0.65, 0.85,
+    0.95, 1.0, 0.95, 0.85, 0.75, 0.7, 0.6, 0.5, 0.35, 0.2, 0.1, 0.1,
+])
+
+# Objective weights, in points
+PLACE_VALUE = 100.0
+OFF_SEASON_VALUE = 0.5
+OFF_SEASON_CROWD = 0.6
+CROWD_PENALTY = 40.0
+TRAVEL_PENALTY = 1.0
+
+# Most valuable places kept per city, scaled to the visits its days can
+# hold; bounds the travel-time matrix
+CANDIDATES_PER_VISIT = 8
+MIN_CANDIDATES = 200
+MAX_CANDIDATES = 1_500
+# Local search rounds without improvement before stopping early
+MAX_STALL = 200
+
+_EPS = 1e-6
+
+
+def _by_category(places, table, default):
+    categories = places['category']
+    if not isinstance(categories.dtype, pd.CategoricalDtype):
+        categories = categories.astype('category')
+    # Code -1 (missing category) picks the trailing default
+    lookup = np.array([table.get(c, default) for c in categories.cat.categories] + [default], dtype=np.float64)
+    return lookup[categories.cat.codes.to_numpy()]
+
+
+def visit_durations(places, visit_minutes=None):
+    """Minutes spent at each place, in row order.
+
+    ``visit_minutes`` may be a number for every place, a mapping of place
+    name to minutes (other places use the category default) or a sequence
+    in row order. Without it a ``visit_minutes`` column is used if present,
+    else the category defaults in :data:`VISIT_MINUTES`.
+    """
+    if visit_minutes is None and 'visit_minutes' in places:
+        visit_minutes = places['visit_minutes'].to_numpy()
+    if visit_minutes is None:
+        minutes = _by_category(places, VISIT_MINUTES, DEFAULT_VISIT_MINUTES)
+    elif np.isscalar(visit_minutes):
+        minutes = np.full(len(places), float(visit_minutes))
+    elif isinstance(visit_minutes, dict):
+        defaults = _by_category(places, VISIT_MINUTES, DEFAULT_VISIT_MINUTES)
+        given = places['place_name'].astype(object).map(visit_minutes).to_numpy(dtype=np.float64)
+        minutes = np.where(np.isnan(given), defaults, given)
+    else:
+        minutes = np.asarray(visit_minutes, dtype=np.float64)
+    # Every visit takes some time, which keeps gain per minute finite
+    return np.maximum(minutes, 1.0)
+
+
+def opening_windows(places):
+    """``(opens, closes)`` in minutes after midnight for each place."""
+    if 'opens' in places and 'closes' in places:
+        return places['opens'].to_numpy(dtype=np.float64) * 60, places['closes'].to_numpy(dtype=np.float64) * 60
+    opens = _by_category(places, {k: v[0] for k, v in OPENING_HOURS.items()}, DEFAULT_OPENING_HOURS[0])
+    closes = _by_category(places, {k: v[1] for k, v in OPENING_HOURS.items()}, DEFAULT_OPENING_HOURS[1])
+    return opens * 60, closes * 60
+
+
+def place_scores(places, month=None):
+    """``(value, crowd)`` for each place; ``month`` (1-12) applies the season."""
+    popularity = places['monthly_visitors'].rank(pct=True).to_numpy(dtype=np.float64)
+    value = PLACE_VALUE * (0.5 + 0.5 * popularity)
+    crowd = popularity.copy()
+    if month:
+        best = places['best_months'] if 'best_months' in places else month_mask_column(places['best_time_to_visit'])
+        in_season = months_filter(np.asarray(best), month)
+        value = np.where(in_season, value, value * OFF_SEASON_VALUE)
+        crowd = np.where(in_season, crowd, crowd * OFF_SEASON_CROWD)
+    return value, crowd
+
+
+def crowd_profile(minutes):
+    """Relative crowd level at ``minutes`` after midnight, interpolated by hour."""
+    return np.interp(np.asarray(minutes) / 60.0, np.arange(25), np.append(HOURLY_CROWD, HOURLY_CROWD[0]))
+
+
+def day_windows(day_hours, day_start=DEFAULT_DAY_START):
+    """``(start, end)`` minutes for each day from a day count or per-day hours."""
+    hours = [DEFAULT_DAY_HOURS] * int(day_hours) if np.isscalar(day_hours) else [float(h) for h in day_hours]
+    start = day_start * 60
+    return [(start, min(start + h * 60, 24 * 60)) for h in hours]
+
+
+def allocate_days(city_values, num_days, per_day):
+    """City index for each day: contiguous runs in the order of ``city_values``.
+
+    Every city gets a day if there are enough; each further day goes to
+    the city whose next ``per_day`` most valuable places are worth most.
+    With fewer days than cities the most valuable cities are kept.
+    """
+    ranked = [np.sort(values)[::-1] for values in city_values]
+
+    def marginal(city, days):
+        return ranked[city][days * per_day:(days + 1) * per_day].sum()
+
+    counts = np.zeros(len(ranked), dtype=int)
+    first = sorted(range(len(ranked)), key=lambda c: -marginal(c, 0))[:num_days]
+    counts[first] = 1
+    for _ in range(num_days - len(first)):
+        city = max(range(len(ranked)), key=lambda c: marginal(c, counts[c]))
+        counts[city] += 1
+    return [city for city in range(len(ranked)) for _ in range(counts[city])]
+
+
+class _CitySolver:
+    """Iterated local search over one city's days; places are row indices of ``travel``."""
+
+    def __init__(self, value, crowd, duration, opens, closes, travel, windows, rng):
+        self.value = value
+        self.crowd = crowd
+        self.duration = duration
+        self.opens = opens
+        # Latest start that still finishes before closing
+        self.latest = closes - duration
+        self.travel = travel
+        self.windows = windows
+        self.rng = rng
+        self.routes = [[] for _ in windows]
+
+    def timeline(self, route, day):
+        """Arrival and start minutes along ``route``, or None if it breaks a window."""
+        t, end = self.windows[day]
+        arrival, start = np.empty(len(route)), np.empty(len(route))
+        prev = None
+        for i, place in enumerate(route):
+            if prev is not None:
+                t += self.travel[prev, place]
+            arrival[i] = t
+            t = max(t, self.opens[place])
+            if t > self.latest[place] + _EPS or t + self.duration[place] > end + _EPS:
+                return None
+            start[i] = t
+            t += self.duration[place]
+            prev = place
+        return arrival, start
+
+    def day_score(self, route, day):
+        times = self.timeline(route, day)
+        if times is None:
+            return -np.inf
+        route = np.asarray(route, dtype=int)
+        _, start = times
+        mid = start + self.duration[route] / 2
+        gain = self.value[route] - CROWD_PENALTY * self.crowd[route] * crowd_profile(mid)
+        return float(gain.sum() - TRAVEL_PENALTY * self.travel[route[:-1], route[1:]].sum())
+
+    def score(self):
+        return sum(self.day_score(route, day) for day, route in enumerate(self.routes))
+
+    def _insertions(self, day, free):
+        """Best gain per minute and position for inserting each place into ``day``."""
+        n = len(self.value)
+        ratios = np.full(n, -np.inf)
+        positions = np.zeros(n, dtype=int)
+        candidates = np.flatnonzero(free)
+        if not len(candidates):
+            return ratios, positions
+        route = np.asarray(self.routes[day], dtype=int)
+        m = len(route)
+        day_start, day_end = self.windows[day]
+        arrival, start = self.timeline(route, day)
+        finish = start + self.duration[route]
+
+        # Latest each visit may be pushed back, from the end of the day backwards
+        max_shift = np.empty(m)
+        slack = np.inf
+        for i in range(m - 1, -1, -1):
+            own = min(self.latest[route[i]], day_end - self.duration[route[i]]) - start[i]
+            max_shift[i] = min(own, slack)
+            slack = max_shift[i] + start[i] - arrival[i]
+
+        # Travel times are symmetric, so one block serves both legs
+        legs = self.travel[np.ix_(candidates, route)]
+        travel_in = np.zeros((len(candidates), m + 1))
+        travel_out = np.zeros((len(candidates), m + 1))
+        travel_in[:, 1:] = legs
+        travel_out[:, :m] = legs
+        replaced = np.zeros(m + 1)
+        replaced[1:m] = self.travel[route[:-1], route[1:]]
+
+        arrive = np.concatenate(([day_start], finish))[None] + travel_in
+        begin = np.maximum(arrive, self.opens[candidates, None])
+        duration = self.duration[candidates, None]
+        feasible = (begin <= self.latest[candidates, None] + _EPS) & (begin + duration <= day_end + _EPS)
+        push = np.maximum(0.0, begin[:, :m] + duration + legs - start[None])
+        feasible[:, :m] &= push <= max_shift[None] + _EPS
+
+        detour = travel_in + travel_out - replaced
+        gain = (
+            self.value[candidates, None]
+            - CROWD_PENALTY * self.crowd[candidates, None] * crowd_profile(begin + duration / 2)
+            - TRAVEL_PENALTY * detour
+        )
+        ratio = np.where(feasible & (gain > 0), gain / (detour + (begin - arrive) + duration), -np.inf)
+        best = ratio.argmax(axis=1)
+        ratios[candidates] = ratio[np.arange(len(candidates)), best]
+        positions[candidates] = best
+        return ratios, positions
+
+    def fill(self, deadline=np.inf):
+        """Greedily insert the best place per minute until nothing more fits or ``deadline``."""
+        free = np.ones(len(self.value), dtype=bool)
+        for route in self.routes:
+            free[route] = False
+        days = len(self.routes)
+        ratios, positions = np.empty((days, len(free))), np.empty((days, len(free)), dtype=int)
+        for day in range(days):
+            ratios[day], positions[day] = self._insertions(day, free)
+        while time.perf_counter() < deadline:
+            day, place = np.unravel_index(int(ratios.argmax()), ratios.shape)
+            if ratios[day, place] == -np.inf:
+                return
+            self.routes[day].insert(int(positions[day, place]), int(place))
+            free[place] = False
+            ratios[:, place] = -np.inf
+            ratios[day], positions[day] = self._insertions(day, free)
+
+    def two_opt(self, day, deadline=np.inf):
+        """Reverse segments of ``day`` while the exact score improves, until ``deadline``."""
+        route = self.routes[day]
+        best = self.day_score(route, day)
+        improved = True
+        while improved:
+            improved = False
+            for i in range(len(route) - 1):
+                if time.perf_counter() >= deadline:
+                    self.routes[day] = route
+                    return
+                for j in range(i + 2, len(route) + 1):
+                    candidate = route[:i] + route[i:j][::-1] + route[j:]
+                    score = self.day_score(candidate, day)
+                    if score > best + _EPS:
+                        route, best, improved = candidate, score, True
+        self.routes[day] = route
+
+    def improve(self, deadline):
+        self.fill(deadline)
+        for day in range(len(self.routes)):
+            self.two_opt(day, deadline)
+        # Shorter routes may have freed time for more visits
+        self.fill(deadline)
+
+    def solve(self, deadline, rounds=None):
+        # The first greedy pass always completes, so even a spent budget
+        # gives full days; only improvement stops at the deadline
+        self.fill()
+        self.improve(deadline)
+        best, best_score = [list(route) for route in self.routes], self.score()
+        longest = max(len(route) for route in best)
+        removed, stall = 1, 0
+        done = 0
+        while time.perf_counter() < deadline and stall < MAX_STALL and longest and (rounds is None or done < rounds):
+            done += 1
+            # Shake: drop a run of ``removed`` visits from every day, then rebuild
+            for route in self.routes:
+                if route:
+                    at = int(self.rng.integers(len(route)))
+                    del route[at:at + removed]
+            self.improve(deadline)
+            score = self.score()
+            if score > best_score + _EPS:
+                best, best_score = [list(route) for route in self.routes], score
+                longest = max(len(route) for route in best)
+                removed, stall = 1, 0
+            else:
+                self.routes = [list(route) for route in best]
+                removed = removed + 1 if removed < max(1, longest // 2) else 1
+                stall += 1
+        self.routes = best
+        return best
+
+
+@timed('schedule.trip')
+def schedule_trip(places, day_hours=3, month=None, visit_minutes=None, day_start=DEFAULT_DAY_START,
+                  time_budget=DEFAULT_TIME_BUDGET, seed=0, distances=None, rounds=None):
+    """Plan a trip over ``places`` (one or more cities) and return a :class:`DayRoute` per day.
+
+    ``day_hours`` is a day count (of :data:`DEFAULT_DAY_HOURS` each) or the
+    hours available on each day, starting at ``day_start`` (hour of day).
+    ``month`` (1-12) weighs places by season. Each day's frame has extra
+    columns ``arrival``, ``start`` and ``end`` (minutes after midnight),
+    ``travel_minutes`` from the previous stop and ``crowd`` (0-1). After a
+    full greedy pass, improvement stops after ``time_budget`` seconds, or
+    ``rounds`` local search rounds per city (for a fixed amount of work). ``distances`` is an optional
+    precomputed matrix for a single city's ``places`` in row order.
+    """
+    deadline = time.perf_counter() + time_budget
+    windows = day_windows(day_hours, day_start)
+    duration = visit_durations(places, visit_minutes)
+    opens, closes = opening_windows(places)
+    value, crowd = place_scores(places, month)
+
+    codes, cities = pd.factorize(places['city'].astype(object))
+    city_rows = [np.flatnonzero(codes == c) for c in range(len(cities))]
+    # Rough visits per day: a median visit plus a short hop
+    per_day = max(1, int(np.mean([end - start for start, end in windows] or [0]) // (np.median(duration) + 20)))
+    day_city = allocate_days([value[rows] for rows in city_rows], len(windows), per_day) if len(cities) else []
+
+    rng = np.random.default_rng(seed)
+    # Build every city's matrix before solving so no city starts past the deadline
+    solvers = []
+    for city, rows in enumerate(city_rows):
+        days = [day for day, c in enumerate(day_city) if c == city]
+        if not days:
+            continue
+        limit = min(MAX_CANDIDATES, max(MIN_CANDIDATES, CANDIDATES_PER_VISIT * per_day * len(days)))
+        if len(rows) > limit:
+            rows = np.sort(rows[np.argsort(-value[rows], kind='stable')[:limit]])
+        if distances is not None and len(cities) == 1:
+            dist = np.asarray(distances[np.ix_(rows, rows)], dtype=np.float64)
+        else:
+            dist = places_distance_matrix(places.iloc[rows])
+        solver = _CitySolver(
+            value[rows], crowd[rows], duration[rows], opens[rows], closes[rows],
+            travel_minutes(dist).astype(np.float64), [windows[day] for day in days], rng,
+        )
+        solvers.append((days, rows, dist, solver))
+
+    plans = [None] * len(windows)
+    remaining = len(windows)
+    for days, rows, dist, solver in solvers:
+        # Share what is left of the budget by the city's number of days
+        now = time.perf_counter()
+        routes = solver.solve(now + max(0.0, deadline - now) * len(days) / remaining, rounds)
+        remaining -= len(days)
+        for k, (day, route) in enumerate(zip(days, routes)):
+            plans[day] = (rows[route] if route else np.empty(0, dtype=int), solver, k, dist, route)
+
+    schedule = []
+    for plan in plans:
+        if plan is None:
+            schedule.append(DayRoute(places.iloc[[]], 0.0))
+            continue
+        positions, solver, k, dist, route = plan
+        arrival, start = solver.timeline(route, k)
+        legs = np.concatenate(([0.0], solver.travel[route[:-1], route[1:]])) if route else np.empty(0)
+        end = start + duration[positions]
+        day_places = places.iloc[positions].assign(
+            arrival=arrival,
+            start=start,
+            end=end,
+            travel_minutes=legs,
+            crowd=crowd[positions] * crowd_profile((start + end) / 2),
+        )
+        distance_km = float(dist[route[:-1], route[1:]].sum()) if route else 0.0
+        schedule.append(DayRoute(day_places, distance_km))
+    return schedule
+
+
+def schedule_key(places, day_hours, month=None, visit_minutes=None, day_start=DEFAULT_DAY_START,
+                 time_budget=DEFAULT_TIME_BUDGET, seed=0):
+    """Normalized cache key for :func:`schedule_trip` options."""
+    hours = tuple(round(end - start, 2) for start, end in day_windows(day_hours, day_start))
+    durations = hashlib.sha1(visit_durations(places, visit_minutes).tobytes()).hexdigest()[:16]
+    # Order-sensitive: days go to cities in row order
+    rows = hashlib.sha1(row_hashes(places).tobytes()).hexdigest()[:16]
+    return (
+        'schedule', rows, hours, int(month or 0), float(day_start), durations,
+        round(float(time_budget), 3), int(seed),
+    )
+
+
+def cached_schedule(places, day_hours, month=None, visit_minutes=None, day_start=DEFAULT_DAY_START,
+                    time_budget=DEFAULT_TIME_BUDGET, seed=0, version=None, distances=None, cache=ITINERARY_CACHE):
+    """:func:`schedule_trip` memoized in ``cache``, like :func:`~tourism.routing.cached_itinerary`."""
+    if version is not None:
+        cache.check_version(version)
+    key = schedule_key(places, day_hours, month, visit_minutes, day_start, time_budget, seed)
+    return cache.get_or_compute(key, lambda: schedule_trip(
+        places, day_hours, month, visit_minutes, day_start, time_budget, seed, distances,
+    ))
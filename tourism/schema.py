@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+
+from tourism.seasons import month_mask
+
+# Repeated strings stored as pandas categoricals
+CATEGORICAL_COLUMNS = ['city', 'category', 'type', 'best_time_to_visit', 'temperature_trend']
+
+NUMERIC_DTYPES = {
+    'monthly_visitors': 'int32',
+    'latitude': 'float32',
+    'longitude': 'float32',
+    'historical_rainfall': 'int32',
+}
+
+# Columns derived from the raw strings once at load time
+DERIVED_DTYPES = {
+    'temp_min': 'float32',
+    'temp_max': 'float32',
+    'best_months': 'uint16',
+}
+
+
+def _per_value(series, parse):
+    # Parse each distinct value once and broadcast back through the codes
+    values = series.astype('category')
+    parsed = [parse(value) for value in values.cat.categories]
+    return values.cat.codes.to_numpy(), parsed
+
+
+def parse_temperature_range(trend):
+    """``"20-45"`` -> ``(20.0, 45.0)``; unparseable values give NaNs."""
+    try:
+        low, high = str(trend).strip().split('-')
+        return float(low), float(high)
+    except ValueError:
+        return np.nan, np.nan
+
+
+def temperature_columns(series):
+    """Vectorized ``temp_min``/``temp_max`` arrays for a temperature_trend column."""
+    codes, parsed = _per_value(series, parse_temperature_range)
+    table = np.array(parsed + [(np.nan, np.nan)], dtype=np.float32).reshape(-1, 2)
+    # Code -1 (missing) picks the trailing NaN row
+    return table[codes, 0], table[codes, 1]
+
+
+def month_mask_column(series):
+    """12-bit best-time mask (bit 0 = January) for a best_time_to_visit column."""
+    codes, parsed = _per_value(series, month_mask)
+    table = np.array(parsed + [0], dtype=np.uint16)
+    return table[codes]
+
+
+def add_derived_columns(df):
+    """Add parsed ``temp_min``, ``temp_max`` and ``best_months`` when missing."""
+    if 'temp_min' not in df or 'temp_max' not in df:
+        df['temp_min'], df['temp_max'] = temperature_columns(df['temperature_trend'])
+    if 'best_months' not in df:
+        df['best_months'] = month_mask_column(df['best_time_to_visit'])
+    return df
+
+
+# Rows without these cannot be shown or grouped
+KEY_COLUMNS = ['place_name', 'city']
+
+
+def _present(series):
+    # Not missing and not an empty string
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        blank = np.asarray(series.cat.categories.astype(str).str.strip() == '')
+        codes = series.cat.codes.to_numpy()
+        return (codes >= 0) & ~np.append(blank, True)[codes]
+    return (series.notna() & (series.astype(str).str.strip() != '')).to_numpy()
+
+
+def _drop_invalid_rows(df):
+    # Rows missing a key string, or a value for an integer column (which
+    # cannot hold NaN), are dropped, as tourism.ingest does
+    keep = np.ones(len(df), dtype=bool)
+    for column in KEY_COLUMNS:
+        if column in df:
+            keep &= _present(df[column])
+    for column, dtype in NUMERIC_DTYPES.items():
+        if column not in df or not np.issubdtype(np.dtype(dtype), np.integer) or df[column].dtype == dtype:
+            continue
+        values = pd.to_numeric(df[column], errors='coerce')
+        keep &= np.isfinite(values.to_numpy(dtype=np.float64, na_value=np.nan))
+        df[column] = values
+    if keep.all():
+        return df
+    df = df[keep]
+    # Drop categories that only the removed rows used (e.g. a blank city)
+    for column in KEY_COLUMNS:
+        if column in df and isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].cat.remove_unused_categories()
+    return df
+
+
+def apply_schema(df, categorical=True):
+    """Compact, typed copy of a places table.
+
+    Visitors and rainfall become int32, coordinates float32, repeated
+    strings categoricals (unless ``categorical=False``), and the derived
+    weather/season columns are added. Rows missing a name, a city or an
+    integer value are dropped. Columns that already have the target
+    dtype are shared rather than copied.
+    """
+    df = add_derived_columns(_drop_invalid_rows(df.copy(deep=False)))
+    dtypes = {**NUMERIC_DTYPES, **DERIVED_DTYPES}
+    for column, dtype in dtypes.items():
+        if column in df and df[column].dtype != dtype:
+            df[column] = df[column].astype(dtype)
+    if categorical:
+        for column in CATEGORICAL_COLUMNS:
+            if column in df and not isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype('category')
+    return df
+
+
+def months_filter(best_months, month):
+    """Boolean mask of rows whose best-time window includes ``month`` (1-12)."""
+    return (np.asarray(best_months) & np.uint16(1 << (month - 1))) != 0
@@ -0,0 +1,248 @@
+"""Type-ahead place search over name, city, category and type.
+
+The index is built once per store:
+
+* Every row is tokenized into lower-case words from its four text fields.
+  Rows are numbered by popularity rank, most visited first.
+* The sorted vocabulary acts as a flattened prefix trie. All words with a
+  given prefix form one contiguous id range, found by binary search.
+* Postings are CSR arrays (word id -> ranks), so the postings of a whole
+  prefix range are a single slice.
+* A trigram index (trigram -> word ids) finds words within a few typos.
+
+A query word scores 1.0 on an exact word, 0.8 on a prefix and up to 0.6
+on a trigram match. A row has to match every query word. Rows rank by
+total score, then by visitors.
+"""
+import re
+
+import numpy as np
+import pandas as pd
+
+from tourism.metrics import timed
+
+SEARCH_COLUMNS = ['place_name', 'city', 'category', 'type']
+
+EXACT_SCORE = 1.0
+PREFIX_SCORE = 0.8
+FUZZY_SCORE = 0.6
+# Minimum trigram Jaccard similarity for a typo match, and how many to keep
+FUZZY_THRESHOLD = 0.25
+FUZZY_LIMIT = 32
+MIN_FUZZY_LENGTH = 3
+# Rows verified against every query word; bounds the cost of short prefixes
+CANDIDATE_LIMIT = 20_000
+# Tighter bound for a lone word this short, which matches much of the table.
+# Every candidate matches a one-word query, so the top ``k`` are unchanged.
+SHORT_PREFIX_LENGTH = 2
+SHORT_PREFIX_LIMIT = 2_000
+
+_TOKEN_PATTERN = re.compile(r"[^\w]+")
+
+
+def tokenize(text):
+    return _TOKEN_PATTERN.sub(' ', str(text).lower()).split()
+
+
+def trigrams(word):
+    padded = f"${word}$"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _split_words(values):
+    """``(row positions, words)`` for every word of a string column."""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError:
+        split = values.astype(str).str.lower().str.replace(_TOKEN_PATTERN, ' ', regex=True).str.split()
+        exploded = pd.Series(split.to_numpy()).explode().dropna()
+        return exploded.index.to_numpy(), exploded.to_numpy(dtype=object)
+
+    # Arrow's vectorized kernels are several times faster than str methods
+    split = pc.split_pattern_regex(pc.utf8_lower(pa.array(values.astype(str).to_numpy(dtype=object))), _TOKEN_PATTERN.pattern)
+    words = pc.list_flatten(split).to_numpy(zero_copy_only=False)
+    row_ids = pc.list_parent_indices(split).to_numpy()
+    keep = words != ''
+    return row_ids[keep], words[keep]
+
+
+def _csr(keys, values, size):
+    """Group ``values`` by integer ``keys`` in [0, size) into offsets + data."""
+    order = np.argsort(keys, kind='stable')
+    offsets = np.zeros(size + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=size), out=offsets[1:])
+    return offsets, values[order]
+
+
+def _gather(offsets, data, ids):
+    """Concatenated CSR rows ``ids`` and the start of each within the result."""
+    starts, stops = offsets[ids], offsets[ids + 1]
+    lengths = stops - starts
+    bounds = np.concatenate([[0], np.cumsum(lengths)])
+    flat = np.arange(bounds[-1]) - np.repeat(bounds[:-1] - starts, lengths)
+    return data[flat], bounds[:-1]
+
+
+class SearchIndex:
+    """Prefix and trigram index over a :class:`~tourism.store.PlaceStore`."""
+
+    def __init__(self, store):
+        self.store = store
+        df = store.df
+        n = len(df)
+        # Rank 0 is the most visited place; ties keep table order
+        self.order = np.argsort(-df['monthly_visitors'].to_numpy(dtype=np.int64), kind='stable')
+        rank_of = np.empty(n, dtype=np.int64)
+        rank_of[self.order] = np.arange(n)
+
+        rows, words = [], []
+        for column in SEARCH_COLUMNS:
+            values = df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # Tokenize each distinct value once and broadcast through the codes
+                value_words = pd.Series(values.cat.categories.map(tokenize)).explode().dropna()
+                offsets, flat = _csr(value_words.index.to_numpy(), value_words.to_numpy(dtype=object), len(values.cat.categories))
+                codes = values.cat.codes.to_numpy().astype(np.int64)
+                row_ids = np.flatnonzero(codes >= 0)
+                gathered, _ = _gather(offsets, flat, codes[row_ids])
+                rows.append(np.repeat(row_ids, np.diff(offsets)[codes[row_ids]]))
+                words.append(gathered)
+            else:
+                row_ids, row_words = _split_words(values)
+                rows.append(row_ids)
+                words.append(row_words)
+        rows = rank_of[np.concatenate(rows)]
+        word_ids, vocabulary = pd.factorize(np.concatenate(words), sort=True)
+        self.vocabulary = np.asarray(vocabulary, dtype=str)
+        v = len(self.vocabulary)
+
+        # One (rank, word) pair per distinct word in a row; sort-based
+        # dedupe is far faster than np.unique's hashing at this size
+        pairs = np.sort(rows * v + word_ids)
+        pairs = pairs[np.concatenate([[True], pairs[1:] != pairs[:-1]])]
+        pair_ranks, pair_words = pairs // v, pairs % v
+        self.post_offsets, self.post_ranks = _csr(pair_words, pair_ranks, v)
+        self.row_offsets, self.row_words = _csr(pair_ranks, pair_words, n)
+
+        grams, gram_words = [], []
+        for word_id, word in enumerate(self.vocabulary):
+            for gram in trigrams(word):
+                grams.append(gram)
+                gram_words.append(word_id)
+        gram_ids, gram_vocabulary = pd.factorize(np.array(grams, dtype=object))
+        self._gram_id = {gram: i for i, gram in enumerate(gram_vocabulary)}
+        self.gram_offsets, self.gram_words = _csr(gram_ids, np.array(gram_words, dtype=np.int64), len(gram_vocabulary))
+        self.word_grams = np.bincount(gram_words, minlength=v)
+
+    def __len__(self):
+        return len(self.store)
+
+    def prefix_range(self, prefix):
+        """Word ids ``[lo, hi)`` of every vocabulary word starting with ``prefix``."""
+        lo = int(np.searchsorted(self.vocabulary, prefix, 'left'))
+        hi = int(np.searchsorted(self.vocabulary, prefix + '\uffff', 'left'))
+        return lo, hi
+
+    def fuzzy(self, word, limit=FUZZY_LIMIT):
+        """Word ids within a few typos of ``word`` and their trigram similarity."""
+        grams = [self._gram_id[g] for g in trigrams(word) if g in self._gram_id]
+        if len(word) < MIN_FUZZY_LENGTH or not grams:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        candidates, _ = _gather(self.gram_offsets, self.gram_words, np.asarray(grams))
+        ids, shared = np.unique(candidates, return_counts=True)
+        similarity = shared / (len(trigrams(word)) + self.word_grams[ids] - shared)
+        keep = similarity >= FUZZY_THRESHOLD
+        ids, similarity = ids[keep], similarity[keep]
+        top = np.argsort(-similarity, kind='stable')[:limit]
+        return ids[top], similarity[top]
+
+    def _word_matches(self, word):
+        lo, hi = self.prefix_range(word)
+        exact = lo < hi and self.vocabulary[lo] == word
+        fuzzy_ids, similarity = self.fuzzy(word)
+        outside = (fuzzy_ids < lo) | (fuzzy_ids >= hi)
+        return {
+            'exact': lo if exact else None,
+            'prefix': (lo + 1 if exact else lo, hi),
+            'fuzzy': (fuzzy_ids[outside], similarity[outside]),
+        }
+
+    def _word_scores(self, matches):
+        scores = np.zeros(len(self.vocabulary), dtype=np.float32)
+        lo, hi = matches['prefix']
+        scores[lo:hi] = PREFIX_SCORE
+        fuzzy_ids, similarity = matches['fuzzy']
+        scores[fuzzy_ids] = FUZZY_SCORE * similarity
+        if matches['exact'] is not None:
+            scores[matches['exact']] = EXACT_SCORE
+        return scores
+
+    def _match_size(self, matches):
+        # Total postings over every word the query word matches
+        lo, hi = matches['prefix']
+        if matches['exact'] is not None:
+            lo = matches['exact']
+        fuzzy_ids, _ = matches['fuzzy']
+        counts = self.post_offsets[fuzzy_ids + 1] - self.post_offsets[fuzzy_ids]
+        return int(self.post_offsets[hi] - self.post_offsets[lo] + counts.sum())
+
+    def _postings(self, lo, hi):
+        return self.post_ranks[self.post_offsets[lo]:self.post_offsets[hi]]
+
+    def _candidates(self, matches, limit):
+        # Best tier first; within a tier the lowest ranks are the most visited
+        tiers = []
+        if matches['exact'] is not None:
+            tiers.append(self._postings(matches['exact'], matches['exact'] + 1))
+        tiers.append(self._postings(*matches['prefix']))
+        fuzzy_ids, _ = matches['fuzzy']
+        if len(fuzzy_ids):
+            tiers.append(_gather(self.post_offsets, self.post_ranks, fuzzy_ids)[0])
+
+        taken = np.empty(0, dtype=np.int64)
+        for ranks in tiers:
+            remaining = limit - len(taken)
+            if remaining <= 0:
+                break
+            # Past ``limit`` a dense mask beats setdiff1d's sorts
+            if len(ranks) > limit:
+                mask = np.zeros(len(self), dtype=bool)
+                mask[ranks] = True
+                mask[taken] = False
+                ranks = np.flatnonzero(mask)
+            else:
+                ranks = np.setdiff1d(ranks, taken)
+            taken = np.concatenate([taken, ranks[:remaining]])
+        return taken
+
+    @timed('search.query')
+    def search(self, query, k=20, limit=CANDIDATE_LIMIT):
+        """Top ``k`` places for ``query`` with a ``match_score`` column.
+
+        The last word may be incomplete, so every word matches as a prefix
+        as well as exactly and by trigrams.
+        """
+        words = tokenize(query)
+        if not words:
+            return self.store.df.iloc[[]].assign(match_score=np.empty(0))
+        matches = [self._word_matches(word) for word in words]
+        sizes = [self._match_size(m) for m in matches]
+        if len(words) == 1 and len(words[0]) <= SHORT_PREFIX_LENGTH:
+            limit = min(limit, max(k, SHORT_PREFIX_LIMIT))
+        # Seed candidates from the most selective word, then verify the rest
+        ranks = self._candidates(matches[int(np.argmin(sizes))], limit)
+        if not len(ranks):
+            return self.store.df.iloc[[]].assign(match_score=np.empty(0))
+
+        row_words, starts = _gather(self.row_offsets, self.row_words, ranks)
+        total = np.zeros(len(ranks), dtype=np.float32)
+        matched = np.ones(len(ranks), dtype=bool)
+        for m in matches:
+            best = np.maximum.reduceat(self._word_scores(m)[row_words], starts)
+            matched &= best > 0
+            total += best
+        ranks, total = ranks[matched], total[matched]
+        top = np.lexsort((ranks, -total))[:k]
+        positions = self.order[ranks[top]]
+        return self.store.df.iloc[positions].assign(match_score=total[top])
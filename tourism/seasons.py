@@ -0,0 +1,31 @@
+MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+_MONTH_INDEX = {name.lower(): i for i, name in enumerate(MONTHS)}
+
+ALL_MONTHS_MASK = (1 << 12) - 1
+
+
+def month_mask(window):
+    """12-bit mask (bit 0 = January) for a window like ``"Oct-Mar"``.
+
+    Windows wrap around the year end. Unparseable values give an empty mask.
+    """
+    if not isinstance(window, str):
+        return 0
+    parts = [part.strip().lower()[:3] for part in window.split('-')]
+    if not parts or any(part not in _MONTH_INDEX for part in parts):
+        return 0
+    start = _MONTH_INDEX[parts[0]]
+    end = _MONTH_INDEX[parts[-1]]
+    mask = 0
+    month = start
+    while True:
+        mask |= 1 << month
+        if month == end:
+            break
+        month = (month + 1) % 12
+    return mask
+
+
+def mask_months(mask):
+    """Month numbers (1-12) set in a 12-bit mask."""
+    return [i + 1 for i in range(12) if mask >> i & 1]
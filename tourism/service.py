@@ -0,0 +1,395 @@
+"""Headless JSON API over the place data, without Streamlit.
+
+The places table, aggregate cube, recommender and forecasters are loaded
+once per process and shared by every request. Itinerary solving is CPU
+heavy, so it runs on a thread or process pool, and plans are memoized in
+:data:`tourism.routing.ITINERARY_CACHE`. Process workers load the table
+once at startup, so a request sends only the city and options. Two limits protect the server:
+
+* ``max_concurrent`` caps requests being handled at once; others wait
+  up to ``queue_timeout`` seconds for a slot
+* ``max_pending`` caps itineraries queued on the pool
+
+Requests over either limit get ``503`` with ``Retry-After``.
+
+Endpoints (all ``GET``, JSON responses):
+
+* ``/health``
+* ``/cities``: cities with visitor totals and place counts
+* ``/places``: filter by ``city``, ``category``, ``type`` and ``month``,
+  or ``lat``/``lon`` with ``radius_km``; paginate with ``limit``/``offset``
+* ``/recommendations``: ``place`` for similar places, or preferences as
+  ``category``, ``type``, ``month``, ``popularity`` and ``city``; ``k`` results
+* ``/forecast``: ``city``, ``model``, ``months``
+* ``/itinerary``: ``city``, ``days``, ``time_budget``
+
+List parameters are comma separated.
+
+Usage::
+
+    python -m tourism.service --port 8600 --workers 4 --pool process
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+
+from tourism.ingest import DEFAULT_CSV, DEFAULT_SNAPSHOT, load_places
+from tourism.matrices import DEFAULT_DIR as DEFAULT_MATRICES, MatrixStore
+from tourism.routing import DEFAULT_TIME_BUDGET, ITINERARY_CACHE, cached_itinerary, plan_itinerary
+from tourism.seasons import MONTHS
+from tourism.store import PlaceStore
+
+PLACE_COLUMNS = [
+    'place_name', 'city', 'category', 'type', 'monthly_visitors', 'latitude', 'longitude',
+    'best_time_to_visit', 'historical_rainfall', 'temperature_trend', 'distance_km', 'score',
+]
+DEFAULT_LIMIT = 24
+MAX_LIMIT = 500
+MAX_DAYS = 14
+MAX_TIME_BUDGET = 5.0
+
+
+_store = None
+_matrices = None
+
+
+def _init_worker(csv_path, snapshot_path, matrix_dir=DEFAULT_MATRICES):
+    # Process workers load the table once (memory-mapped when a snapshot
+    # exists) so requests only carry (city, days, budget)
+    global _store, _matrices
+    _store = PlaceStore(load_places(csv_path, snapshot_path))
+    _matrices = MatrixStore(matrix_dir)
+
+
+def _plan(city, days, time_budget, store=None, matrices=None):
+    """Plan one itinerary; returns ``(data version, routes)``.
+
+    ``store`` and ``matrices`` default to the ones a process worker loaded.
+    """
+    if store is None:
+        store = _store
+    if matrices is None:
+        matrices = _matrices
+    places = store.city(city)
+    distances = matrices.for_places(places) if matrices is not None else None
+    return store.version, plan_itinerary(places, days, time_budget, distances=distances)
+
+
+class ServiceError(Exception):
+    """An error reported to the client with an HTTP status."""
+
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+def _records(frame):
+    """JSON-ready rows with the public place columns."""
+    columns = [column for column in PLACE_COLUMNS if column in frame]
+    out = frame[columns].copy()
+    # Coordinates are float32; round away the widening noise
+    for column, digits in (('latitude', 5), ('longitude', 5), ('distance_km', 3), ('score', 6)):
+        if column in out:
+            out[column] = out[column].astype('float64').round(digits)
+    # Missing values become null; json.dumps would write a bare NaN
+    out = out.astype(object)
+    return out.where(out.notna(), None).to_dict('records')
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+class Params:
+    """Typed access to query-string parameters; bad values raise a 400."""
+
+    def __init__(self, query):
+        self._query = parse_qs(query)
+
+    def get(self, name, default=None):
+        values = self._query.get(name)
+        return values[-1] if values else default
+
+    def list(self, name):
+        values = [v for raw in self._query.get(name, []) for v in raw.split(',')]
+        return [v.strip() for v in values if v.strip()] or None
+
+    def number(self, name, default=None, cast=float, low=None, high=None):
+        raw = self.get(name)
+        if raw is None:
+            return default
+        try:
+            value = cast(raw)
+        except ValueError:
+            raise ServiceError(400, f"{name} must be a number") from None
+        if (low is not None and value < low) or (high is not None and value > high):
+            raise ServiceError(400, f"{name} must be between {low} and {high}")
+        return value
+
+    def month(self):
+        raw = self.get('month')
+        if raw is None:
+            return None
+        if raw[:3].title() in MONTHS:
+            return MONTHS.index(raw[:3].title()) + 1
+        return self.number('month', cast=int, low=1, high=12)
+
+
+class Service:
+    """Shared data and request handlers; safe to call from many threads."""
+
+    def __init__(self, store, workers=None, pool='process', max_concurrent=32, max_pending=64, timeout=30.0, queue_timeout=1.0,
+                 data=(DEFAULT_CSV, DEFAULT_SNAPSHOT, DEFAULT_MATRICES)):
+        self.store = store
+        self._cities = set(store.cities)
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._lock = threading.Lock()
+        self._cube = None
+        self._recommender = None
+        self._forecasters = {}
+        # Thread workers share ``store`` and ``matrices``; process workers load ``data`` once each
+        self._process_pool = pool == 'process'
+        self.matrices = None
+        if self._process_pool:
+            self.pool = ProcessPoolExecutor(max_workers=workers or os.cpu_count(), initializer=_init_worker, initargs=data)
+        else:
+            self.matrices = MatrixStore(data[2])
+            self.pool = ThreadPoolExecutor(max_workers=workers or os.cpu_count())
+        ITINERARY_CACHE.check_version(store.version)
+
+    def close(self):
+        self.pool.shutdown(wait=False, cancel_futures=True)
+
+    # Built on first use, then shared
+
+    @property
+    def cube(self):
+        with self._lock:
+            if self._cube is None:
+                from tourism.aggregates import AggregateCube
+
+                self._cube = AggregateCube(self.store.df)
+            return self._cube
+
+    @property
+    def recommender(self):
+        with self._lock:
+            if self._recommender is None:
+                from tourism.recommend import Recommender
+
+                self._recommender = Recommender(self.store)
+            return self._recommender
+
+    def forecaster(self, model):
+        from tourism.forecast import MODELS, Forecaster
+
+        if model not in MODELS:
+            raise ServiceError(400, f"Unknown model {model!r}; choose from {', '.join(MODELS)}")
+        with self._lock:
+            if model not in self._forecasters:
+                self._forecasters[model] = Forecaster(self.store, model)
+            return self._forecasters[model]
+
+    def _city(self, params, required=False):
+        city = params.get('city')
+        if city is None:
+            if required:
+                raise ServiceError(400, "city is required")
+            return None
+        if city not in self._cities:
+            raise ServiceError(404, f"Unknown city {city!r}")
+        return city
+
+    def handle(self, path, query):
+        """Dispatch one request; returns a JSON-serializable body."""
+        handler = ROUTES.get(path.rstrip('/') or '/')
+        if handler is None:
+            raise ServiceError(404, f"No such endpoint {path!r}")
+        # Wait briefly for a slot so short bursts queue instead of failing
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise ServiceError(503, "Too many concurrent requests", {'Retry-After': '1'})
+        try:
+            return handler(self, Params(query))
+        finally:
+            self._slots.release()
+
+    def health(self, params):
+        return {'status': 'ok', 'places': len(self.store), 'version': self.store.version}
+
+    def cities(self, params):
+        totals = self.cube.totals(self.store.cities)
+        return {'cities': [
+            {'city': city, 'places': row['places'], 'monthly_visitors': row['visitors']}
+            for city, row in totals.iterrows()
+        ]}
+
+    def places(self, params):
+        limit = params.number('limit', DEFAULT_LIMIT, int, 1, MAX_LIMIT)
+        offset = params.number('offset', 0, int, 0)
+        lat = params.number('lat', low=-90, high=90)
+        lon = params.number('lon', low=-180, high=180)
+        if (lat is None) != (lon is None):
+            raise ServiceError(400, "lat and lon must be given together")
+        if lat is not None:
+            radius = params.number('radius_km', 25.0, float, 0.1, 1000)
+            # Every place in the radius, so ``total`` counts them all
+            frame = self.store.near(lat, lon, radius_km=radius)
+        else:
+            frame = self.store.filter(self._city(params), params.list('category'), params.list('type'), params.month())
+        return {'total': len(frame), 'offset': offset, 'places': _records(frame.iloc[offset:offset + limit])}
+
+    def recommendations(self, params):
+        k = params.number('k', 10, int, 1, MAX_LIMIT)
+        cities = params.list('city')
+        name = params.get('place')
+        if name is not None:
+            positions = np.flatnonzero(self.store.df['place_name'].to_numpy() == name)
+            if not len(positions):
+                raise ServiceError(404, f"Unknown place {name!r}")
+            frame = self.recommender.similar(int(positions[0]), k=k, cities=cities)
+        else:
+            frame = self.recommender.rank(
+                params.list('category') or (),
+                params.list('type') or (),
+                params.month(),
+                params.number('popularity', 0.0, float, 0.0, 1.0),
+                cities,
+                k,
+            )
+        return {'places': _records(frame)}
+
+    def forecast(self, params):
+        city = self._city(params, required=True)
+        model = params.get('model', 'linear')
+        months = params.number('months', 6, int, 1, 36)
+        return {'city': city, 'model': model, 'forecast': self.forecaster(model).predict(city, months)}
+
+    def _solve(self, city, days, budget):
+        # Runs on a cache miss; the pending slot is held until the job ends,
+        # even after a timeout here
+        if not self._pending.acquire(blocking=False):
+            raise ServiceError(503, "Itinerary queue is full", {'Retry-After': '2'})
+        try:
+            if self._process_pool:
+                future = self.pool.submit(_plan, city, days, budget)
+            else:
+                future = self.pool.submit(_plan, city, days, budget, self.store, self.matrices)
+        except BaseException:
+            self._pending.release()
+            raise
+        future.add_done_callback(lambda _: self._pending.release())
+        try:
+            version, routes = future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise ServiceError(504, "Itinerary planning timed out") from None
+        if version != self.store.version:
+            raise ServiceError(503, "Itinerary workers are on different data; restart the service", {'Retry-After': '5'})
+        return routes
+
+    def itinerary(self, params):
+        city = self._city(params, required=True)
+        days = params.number('days', 3, int, 1, MAX_DAYS)
+        budget = params.number('time_budget', DEFAULT_TIME_BUDGET, float, 0.0, MAX_TIME_BUDGET)
+        places = self.store.city(city)
+        routes = cached_itinerary(places, days, budget, version=self.store.version, plan=lambda: self._solve(city, days, budget))
+        return {'city': city, 'days': [
+            {'day': day + 1, 'distance_km': round(route.distance_km, 3), 'places': _records(route.places)}
+            for day, route in enumerate(routes)
+        ]}
+
+
+ROUTES = {
+    '/health': Service.health,
+    '/cities': Service.cities,
+    '/places': Service.places,
+    '/recommendations': Service.recommendations,
+    '/forecast': Service.forecast,
+    '/itinerary': Service.itinerary,
+}
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    server_version = 'TourismService/1.0'
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        headers = {}
+        try:
+            status, body = 200, self.server.service.handle(url.path, url.query)
+        except ServiceError as e:
+            status, body, headers = e.status, {'error': str(e)}, e.headers
+        except Exception as e:  # pragma: no cover - reported to the client
+            self.log_error("Unhandled error for %s: %r", self.path, e)
+            status, body = 500, {'error': 'Internal server error'}
+        payload = json.dumps(body, default=_json_default).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+def make_server(service, host='127.0.0.1', port=8600):
+    server = ThreadingHTTPServer((host, port), RequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve places, recommendations and itineraries as JSON.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8600)
+    parser.add_argument('--workers', type=int, default=None, help="Itinerary pool size (default: CPU count)")
+    parser.add_argument('--pool', choices=['process', 'thread'], default='process')
+    parser.add_argument('--max-concurrent', type=int, default=32, help="Requests handled at once")
+    parser.add_argument('--max-pending', type=int, default=64, help="Itineraries queued on the pool")
+    parser.add_argument('--timeout', type=float, default=30.0, help="Seconds to wait for one itinerary")
+    parser.add_argument('--queue-timeout', type=float, default=1.0, help="Seconds a request waits for a free slot")
+    parser.add_argument('--csv', default=DEFAULT_CSV)
+    parser.add_argument('--snapshot', default=DEFAULT_SNAPSHOT)
+    parser.add_argument('--matrices', default=DEFAULT_MATRICES, help="Prebuilt distance matrices for process workers")
+    args = parser.parse_args(argv)
+
+    service = Service(
+        PlaceStore(load_places(args.csv, args.snapshot)),
+        workers=args.workers,
+        pool=args.pool,
+        max_concurrent=args.max_concurrent,
+        max_pending=args.max_pending,
+        timeout=args.timeout,
+        queue_timeout=args.queue_timeout,
+        data=(args.csv, args.snapshot, args.matrices),
+    )
+    server = make_server(service, args.host, args.port)
+    print(f"Serving {len(service.store):,} places on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,108 @@
+import numpy as np
+
+from tourism.distance import EARTH_RADIUS_KM, haversine
+
+KM_PER_DEGREE = np.pi * EARTH_RADIUS_KM / 180
+
+# Default grid cell edge in degrees (~5.5 km of latitude)
+DEFAULT_CELL_DEG = 0.05
+
+
+class SpatialIndex:
+    """Uniform lat/lon grid over a set of points for radius and k-nearest queries.
+
+    Points are sorted by row-major cell id, so every grid row crossed by a
+    query box maps to one contiguous run found with ``searchsorted``; only
+    those candidates get exact haversine distances.
+    """
+
+    def __init__(self, lats, lons, cell_deg=DEFAULT_CELL_DEG):
+        self.cell_deg = cell_deg
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        self._n_cols = int(np.ceil(360 / cell_deg)) + 1
+        rows, cols = self._cell(lats, lons)
+        keys = rows * self._n_cols + cols
+        self._order = np.argsort(keys, kind='stable')
+        self._keys = keys[self._order]
+        self._lats = lats[self._order]
+        self._lons = lons[self._order]
+
+    @classmethod
+    def from_frame(cls, places, cell_deg=DEFAULT_CELL_DEG):
+        return cls(places['latitude'].to_numpy(), places['longitude'].to_numpy(), cell_deg)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _cell(self, lats, lons):
+        rows = np.floor((np.asarray(lats) + 90) / self.cell_deg).astype(np.int64)
+        cols = np.floor((np.asarray(lons) + 180) / self.cell_deg).astype(np.int64)
+        return rows, cols
+
+    def _lon_ranges(self, lon, dlon):
+        # Boxes crossing the antimeridian wrap into a second column range
+        if dlon >= 180.0:
+            return [(-180.0, 180.0)]
+        lo, hi = lon - dlon, lon + dlon
+        ranges = []
+        if lo < -180.0:
+            ranges.append((lo + 360.0, 180.0))
+            lo = -180.0
+        if hi > 180.0:
+            ranges.append((-180.0, hi - 360.0))
+            hi = 180.0
+        ranges.append((lo, hi))
+        return ranges
+
+    def _candidates(self, lat, lon, radius_km):
+        dlat = radius_km / KM_PER_DEGREE
+        cos_lat = max(np.cos(np.radians(min(abs(lat) + dlat, 90.0))), 1e-6)
+        dlon = min(radius_km / (KM_PER_DEGREE * cos_lat), 180.0)
+        runs = []
+        for lon_lo, lon_hi in self._lon_ranges(lon, dlon):
+            (row_lo, row_hi), (col_lo, col_hi) = self._cell(
+                [max(lat - dlat, -90.0), min(lat + dlat, 90.0)],
+                [lon_lo, lon_hi],
+            )
+            row_ids = np.arange(row_lo, row_hi + 1) * self._n_cols
+            starts = np.searchsorted(self._keys, row_ids + col_lo, side='left')
+            stops = np.searchsorted(self._keys, row_ids + col_hi, side='right')
+            runs.extend(np.arange(a, b) for a, b in zip(starts, stops) if b > a)
+        return np.concatenate(runs) if runs else np.empty(0, dtype=np.int64)
+
+    def within(self, lat, lon, radius_km):
+        """Positions and distances of all points within ``radius_km``, nearest first."""
+        sorted_pos = self._candidates(lat, lon, radius_km)
+        dist = haversine(lat, lon, self._lats[sorted_pos], self._lons[sorted_pos])
+        keep = dist <= radius_km
+        sorted_pos, dist = sorted_pos[keep], dist[keep]
+        order = np.argsort(dist, kind='stable')
+        return self._order[sorted_pos[order]], dist[order]
+
+    def nearest(self, lat, lon, k, radius_km=None):
+        """Positions and distances of the ``k`` nearest points, nearest first.
+
+        The search radius starts at one grid cell and doubles until at least
+        ``k`` points fall inside it, which guarantees the exact k nearest.
+        ``radius_km`` optionally caps the search.
+        """
+        if k <= 0 or not len(self):
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        k = min(k, len(self))
+        radius = self.cell_deg * KM_PER_DEGREE
+        limit = radius_km if radius_km is not None else np.pi * EARTH_RADIUS_KM
+        while True:
+            radius = min(radius, limit)
+            sorted_pos = self._candidates(lat, lon, radius)
+            dist = haversine(lat, lon, self._lats[sorted_pos], self._lons[sorted_pos])
+            inside = dist <= radius
+            if inside.sum() >= k or radius >= limit:
+                break
+            radius *= 2
+        sorted_pos, dist = sorted_pos[inside], dist[inside]
+        if len(dist) > k:
+            top = np.argpartition(dist, k - 1)[:k]
+            sorted_pos, dist = sorted_pos[top], dist[top]
+        order = np.argsort(dist, kind='stable')
+        return self._order[sorted_pos[order]], dist[order]
@@ -0,0 +1,153 @@
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from tourism.metrics import timed
+from tourism.schema import apply_schema, months_filter
+from tourism.spatial import SpatialIndex
+
+# Columns stored as pandas categoricals and indexed for fast lookups
+INDEXED_COLUMNS = ('city', 'category', 'type')
+
+
+def row_hashes(df):
+    """Stable per-row content hash, used to diff two versions of the table."""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+def fingerprint(hashes):
+    """Order-insensitive fingerprint of a multiset of row hashes.
+
+    Hashing the sorted hashes keeps duplicate rows apart, where an XOR of
+    them would cancel pairs out.
+    """
+    digest = hashlib.sha1(np.sort(np.asarray(hashes, dtype=np.uint64)).tobytes()).hexdigest()[:16]
+    return f"{len(hashes):x}-{digest}"
+
+
+def data_version(df):
+    """Order-insensitive fingerprint of the table contents."""
+    return fingerprint(row_hashes(df))
+
+
+class PlaceStore:
+    """Places table pre-split by city with categorical lookup indexes.
+
+    Rows are stably sorted by city (in order of first appearance) so that
+    every city is a contiguous block that can be sliced without scanning
+    the whole table.
+    """
+
+    def __init__(self, df):
+        # Columns already in the compact schema keep sharing memory with
+        # ``df``, which matters when it is backed by a memory-mapped snapshot
+        df = apply_schema(df)
+        self.cities = [city for city in pd.unique(df['city']) if not pd.isna(city)]
+        if not (isinstance(df['city'].dtype, pd.CategoricalDtype) and list(df['city'].cat.categories) == self.cities):
+            df['city'] = pd.Categorical(df['city'], categories=self.cities)
+        for column in INDEXED_COLUMNS[1:]:
+            if not isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype('category')
+
+        codes = df['city'].cat.codes.to_numpy()
+        # Snapshots from tourism.ingest are already grouped by city
+        if np.all(codes[1:] >= codes[:-1]):
+            self.df = df
+        else:
+            self.df = df.iloc[np.argsort(codes, kind='stable')]
+
+        counts = np.bincount(self.df['city'].cat.codes.to_numpy(), minlength=len(self.cities))
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        self._city_slices = {
+            city: slice(int(bounds[i]), int(bounds[i + 1]))
+            for i, city in enumerate(self.cities)
+        }
+
+        # Positional row indexes for every value of every indexed column
+        self._indexes = {
+            column: {
+                value: positions
+                for value, positions in self.df.groupby(column, observed=True).indices.items()
+            }
+            for column in INDEXED_COLUMNS
+        }
+
+        self.spatial = SpatialIndex.from_frame(self.df)
+        self._version = None
+
+    def __len__(self):
+        return len(self.df)
+
+    @property
+    def version(self):
+        """Content fingerprint of the table, computed on first use."""
+        if self._version is None:
+            self._version = data_version(self.df)
+        return self._version
+
+    def city_slice(self, city):
+        return self._city_slices.get(city, slice(0, 0))
+
+    def city(self, city):
+        """All places in ``city`` as a contiguous slice of the table."""
+        return self.df.iloc[self.city_slice(city)]
+
+    def cities_frame(self, cities):
+        """Places for several cities, concatenated in the order given."""
+        slices = [self.city_slice(city) for city in cities]
+        positions = np.concatenate([np.arange(s.start, s.stop) for s in slices]) if slices else []
+        return self.df.iloc[positions]
+
+    def values(self, column, city=None):
+        """Distinct values of an indexed column, optionally within one city."""
+        if city is None:
+            return list(self._indexes[column])
+        return list(pd.unique(self.city(city)[column].astype(object)))
+
+    def lookup(self, column, value):
+        """All places whose indexed ``column`` equals ``value``."""
+        positions = self._indexes[column].get(value, np.empty(0, dtype=np.intp))
+        return self.df.iloc[positions]
+
+    def by_category(self, category):
+        return self.lookup('category', category)
+
+    def by_type(self, place_type):
+        return self.lookup('type', place_type)
+
+    @timed('store.filter')
+    def filter(self, city=None, categories=None, types=None, month=None):
+        """Places in ``city`` restricted to the given categories, types and month.
+
+        ``None`` means no restriction. Matching is done on categorical codes
+        and the best-time month bitmask within the city's slice only.
+        """
+        frame = self.df if city is None else self.city(city)
+        mask = np.ones(len(frame), dtype=bool)
+        for column, wanted in (('category', categories), ('type', types)):
+            if wanted is None:
+                continue
+            series = frame[column]
+            wanted_codes = series.cat.categories.get_indexer(list(wanted))
+            mask &= np.isin(series.cat.codes.to_numpy(), wanted_codes[wanted_codes >= 0])
+        if month is not None:
+            mask &= months_filter(frame['best_months'].to_numpy(), month)
+        return frame[mask]
+
+    def good_in_month(self, month, city=None):
+        """Places whose best-time window includes ``month`` (1-12)."""
+        return self.filter(city, month=month)
+
+    @timed('store.near')
+    def near(self, lat, lon, radius_km=None, k=None):
+        """Places around a point, nearest first, with a ``distance_km`` column.
+
+        Give ``k`` for the k nearest (optionally capped by ``radius_km``),
+        or only ``radius_km`` for every place within that distance.
+        """
+        if k is not None:
+            positions, distances = self.spatial.nearest(lat, lon, k, radius_km=radius_km)
+        else:
+            positions, distances = self.spatial.within(lat, lon, radius_km)
+        return self.df.iloc[positions].assign(distance_km=distances)
@@ -0,0 +1,142 @@
+"""Synthetic place catalogs with the ``top_indian_places.csv`` schema.
+
+Cities start from the real ones in the bundled CSV and continue with
+random centres inside India's bounding box. Places scatter around their
+city centre with a per-city spread of a few kilometres. Weather columns
+are per city, as in the real data, and category/type pairs follow the
+real frequencies.
+
+Usage::
+
+    python -m tourism.synthetic --cities 2000 --places 500 --output data/synthetic.csv
+"""
+import argparse
+import sys
+
+import numpy as np
+import pandas as pd
+
+# (name, latitude, longitude) of the cities in the bundled dataset
+SEED_CITIES = [
+    ('Delhi', 28.6139, 77.2090),
+    ('Mumbai', 19.0760, 72.8777),
+    ('Jaipur', 26.9124, 75.7873),
+    ('Agra', 27.1767, 78.0081),
+    ('Varanasi', 25.3176, 82.9739),
+    ('Goa', 15.2993, 74.1240),
+    ('Kerala', 10.8505, 76.2711),
+    ('Bengaluru', 12.9716, 77.5946),
+    ('Hyderabad', 17.3850, 78.4867),
+    ('Kolkata', 22.5726, 88.3639),
+]
+
+# Rough mainland bounding box for additional city centres
+LATITUDE_RANGE = (8.5, 32.0)
+LONGITUDE_RANGE = (70.0, 88.5)
+
+# (category, type, weight) from the bundled dataset
+CATEGORY_TYPES = [
+    ('Historical', 'Fort', 11), ('Historical', 'Palace', 7), ('Historical', 'Tomb', 6),
+    ('Historical', 'Monument', 5), ('Historical', 'Museum', 1), ('Historical', 'Heritage Site', 1),
+    ('Religious', 'Temple', 13), ('Religious', 'Church', 4), ('Religious', 'Ghat', 3),
+    ('Religious', 'Mosque', 3), ('Religious', 'Shrine', 1),
+    ('Scenic', 'Beach', 9), ('Scenic', 'Lake', 1), ('Scenic', 'Island', 1),
+    ('Nature', 'Garden', 4), ('Nature', 'National Park', 2), ('Nature', 'Waterfall', 2),
+    ('Nature', 'Hill Station', 2), ('Garden', 'Garden', 3), ('Museum', 'Museum', 4),
+    ('Entertainment', 'Theme Park', 3), ('Educational', 'Science Center', 2),
+    ('Modern', 'Bridge', 2), ('Shopping', 'Market', 1), ('Shopping', 'Shopping Mall', 1),
+    ('Sports', 'Stadium', 1), ('Art', 'Museum', 1), ('Recreation', 'Park', 1),
+]
+
+TEMPERATURE_TRENDS = ['20-45', '25-45', '20-35', '25-35', '25-40', '23-35', '15-45', '10-30']
+BEST_TIMES = ['Oct-Mar', 'Oct-Mar', 'Oct-Mar', 'Oct-May', 'Nov-Feb', 'Mar-Jun', 'Jun-Sep']
+
+COLUMNS = [
+    'place_name', 'city', 'category', 'monthly_visitors', 'latitude', 'longitude',
+    'type', 'best_time_to_visit', 'historical_rainfall', 'temperature_trend',
+]
+
+
+def city_table(num_cities, seed=0):
+    """Name, centre, spread and weather for ``num_cities`` cities."""
+    rng = np.random.default_rng(seed)
+    names = [name for name, _, _ in SEED_CITIES[:num_cities]]
+    names += [f"City {i:05d}" for i in range(len(names), num_cities)]
+    lats = rng.uniform(*LATITUDE_RANGE, num_cities)
+    lons = rng.uniform(*LONGITUDE_RANGE, num_cities)
+    for i, (_, lat, lon) in enumerate(SEED_CITIES[:num_cities]):
+        lats[i], lons[i] = lat, lon
+    return pd.DataFrame({
+        'city': names,
+        'latitude': lats,
+        'longitude': lons,
+        # Degrees; most cities span a few km, a few are whole regions
+        'spread': np.clip(rng.lognormal(np.log(0.04), 0.8, num_cities), 0.005, 1.0),
+        'historical_rainfall': (np.clip(rng.lognormal(np.log(1100), 0.5, num_cities), 300, 4000) // 50 * 50).astype(int),
+        'temperature_trend': rng.choice(TEMPERATURE_TRENDS, num_cities),
+        'best_time_to_visit': rng.choice(BEST_TIMES, num_cities),
+    })
+
+
+def generate_places(num_cities, places_per_city, seed=0):
+    """Synthetic catalog of ``num_cities * places_per_city`` rows, grouped by city."""
+    rng = np.random.default_rng(seed)
+    cities = city_table(num_cities, seed)
+    rows = num_cities * places_per_city
+    city_index = np.repeat(np.arange(num_cities), places_per_city)
+
+    weights = np.array([w for _, _, w in CATEGORY_TYPES], dtype=float)
+    pair = rng.choice(len(CATEGORY_TYPES), rows, p=weights / weights.sum())
+    categories = np.array([c for c, _, _ in CATEGORY_TYPES], dtype=object)[pair]
+    types = np.array([t for _, t, _ in CATEGORY_TYPES], dtype=object)[pair]
+
+    spread = cities['spread'].to_numpy()[city_index]
+    lat = cities['latitude'].to_numpy()[city_index] + rng.normal(0, 1, rows) * spread
+    lon = cities['longitude'].to_numpy()[city_index] + rng.normal(0, 1, rows) * spread
+    visitors = np.clip(rng.lognormal(np.log(70_000), 0.8, rows), 1_000, 2_000_000) // 1_000 * 1_000
+
+    city_names = cities['city'].to_numpy(dtype=object)[city_index]
+    ordinal = np.tile(np.arange(1, places_per_city + 1), num_cities)
+    return pd.DataFrame({
+        'place_name': [f"{c} {t} {n}" for c, t, n in zip(city_names, types, ordinal)],
+        'city': city_names,
+        'category': categories,
+        'monthly_visitors': visitors.astype(np.int64),
+        'latitude': np.clip(lat, -90, 90).round(4),
+        'longitude': np.clip(lon, -180, 180).round(4),
+        'type': types,
+        'best_time_to_visit': cities['best_time_to_visit'].to_numpy()[city_index],
+        'historical_rainfall': cities['historical_rainfall'].to_numpy()[city_index],
+        'temperature_trend': cities['temperature_trend'].to_numpy()[city_index],
+    }, columns=COLUMNS)
+
+
+def catalog_shape(rows, places_per_city=500):
+    """``(num_cities, places_per_city)`` for a catalog of about ``rows`` rows."""
+    places_per_city = max(1, min(places_per_city, rows))
+    return max(1, round(rows / places_per_city)), places_per_city
+
+
+def write_csv(path, rows, places_per_city=500, seed=0):
+    """Write a catalog of about ``rows`` rows to ``path``; returns the row count."""
+    df = generate_places(*catalog_shape(rows, places_per_city), seed=seed)
+    df.to_csv(path, index=False)
+    return len(df)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic places catalog.")
+    parser.add_argument('--cities', type=int, default=200)
+    parser.add_argument('--places', type=int, default=500, help="Places per city")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='data/synthetic.csv')
+    args = parser.parse_args(argv)
+
+    df = generate_places(args.cities, args.places, args.seed)
+    df.to_csv(args.output, index=False)
+    print(f"Wrote {len(df):,} places in {args.cities:,} cities to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,11 @@
+"""Streamlit page modules, each exposing ``render()``."""
+
+# Each page lives in its own module under views/, imported on first visit
+PAGE_MODULES = {
+    "Home": "views.home",
+    "Place Recommender": "views.recommender",
+    "Itinerary Planner": "views.itinerary",
+    "Analytics": "views.analytics",
+    "City Comparison": "views.comparison",
+    "About": "views.about",
+}
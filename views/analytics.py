@@ -0,0 +1,122 @@
+import streamlit as st
+
+from tourism.clusters import MAX_MARKERS
+from tourism.forecast import MODELS
+from views.charts import (
+    category_pie_figure,
+    place_cluster_figure,
+    temperature_gauge_figure,
+    top_places_figure,
+    type_bar_figure,
+    visitor_forecast_figure,
+)
+from views.common import create_metric_card, load_clusters, load_cube, load_store
+
+
+def render():
+    store = load_store()
+
+    st.title("Analytics Dashboard")
+    
+    # Enhanced city selection
+    selected_city = st.selectbox(
+        "Select a City",
+        store.cities,
+        format_func=lambda x: f"🏙️ {x}"
+    )
+    
+    cube = load_cube()
+    city_weather = cube.weather.loc[selected_city]
+    
+    # Create tabs with enhanced styling
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "📊 Visitor Statistics",
+        "🌡️ Weather Analysis",
+        "📈 Category Distribution",
+        "🗺️ Place Clustering"
+    ])
+    
+    with tab1:
+        st.subheader("Visitor Statistics")
+        
+        # Total visitors with enhanced metric card
+        total_visitors = cube.city_totals.at[selected_city, 'visitors']
+        st.markdown(
+            create_metric_card(
+                "Total Monthly Visitors",
+                f"{total_visitors:,}",
+                "Across all places"
+            ),
+            unsafe_allow_html=True
+        )
+        
+        # Visitor prediction with enhanced visualization
+        st.subheader("Visitor Prediction")
+        forecast_model = st.selectbox(
+            "Forecast Model",
+            list(MODELS),
+            format_func=lambda m: m.replace('_', ' ').title()
+        )
+        fig = visitor_forecast_figure(selected_city, forecast_model)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Top 5 busiest places with enhanced visualization
+        st.subheader("Top 5 Busiest Places")
+        fig = top_places_figure(selected_city)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with tab2:
+        st.subheader("Weather Analysis")
+        
+        # Temperature trend with enhanced gauge
+        fig = temperature_gauge_figure(selected_city)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Rainfall and best time with enhanced cards
+        col1, col2 = st.columns(2)
+        with col1:
+            st.markdown(
+                create_metric_card(
+                    "Historical Rainfall",
+                    f"{city_weather['historical_rainfall']} mm"
+                ),
+                unsafe_allow_html=True
+            )
+        with col2:
+            st.markdown(
+                create_metric_card(
+                    "Best Time to Visit",
+                    city_weather['best_time_to_visit']
+                ),
+                unsafe_allow_html=True
+            )
+    
+    with tab3:
+        st.subheader("Category Distribution")
+        
+        # Category distribution with enhanced pie chart
+        fig = category_pie_figure(selected_city)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Type distribution with enhanced bar chart
+        fig = type_bar_figure(selected_city)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with tab4:
+        st.subheader("Place Clustering")
+        
+        # Grid clusters; the default is the finest level that stays readable
+        clusters = load_clusters()
+        zoom_level = st.select_slider(
+            "Zoom Level",
+            options=range(len(clusters.levels)),
+            value=clusters.auto_level(selected_city),
+            format_func=lambda level: clusters.level_names[level]
+        )
+        markers = clusters.clusters(selected_city, zoom_level)
+        st.caption(
+            f"{len(markers):,} clusters from {int(markers['places'].sum()):,} places"
+            + (f" (showing the busiest {MAX_MARKERS})" if len(markers) > MAX_MARKERS else "")
+        )
+        fig = place_cluster_figure(selected_city, zoom_level)
+        st.plotly_chart(fig, use_container_width=True)
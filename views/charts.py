@@ -0,0 +1,190 @@
+import functools
+import json
+
+import plotly.express as px
+import plotly.graph_objects as go
+
+from tourism.cache import LRUCache
+from tourism.metrics import REGISTRY, span
+from views.common import load_clusters, load_cube, load_forecaster, load_store
+
+def _json_size(figure):
+    return len(json.dumps(figure))
+
+# Plain figure dicts keyed by (chart kind, arguments, data version), sized by
+# their JSON length. Module-level, so it is shared by every session in the
+# server process; st.plotly_chart only reads them.
+FIGURE_CACHE = LRUCache(maxsize=512, max_bytes=64 * 1024 * 1024, sizeof=_json_size)
+
+REGISTRY.register_cache('figures', FIGURE_CACHE)
+
+LEGEND_TOP = dict(
+    orientation="h",
+    yanchor="bottom",
+    y=1.02,
+    xanchor="right",
+    x=1
+)
+
+def cached_figure(kind):
+    """Cache a chart builder's figure as a dict; a hit skips aggregation and Plotly construction."""
+    def decorator(build):
+        @functools.wraps(build)
+        def wrapper(*args):
+            with span(f'chart.{kind}'):
+                key = (kind, args, load_store().version)
+                return FIGURE_CACHE.get_or_compute(key, lambda: json.loads(build(*args).to_json()))
+        return wrapper
+    return decorator
+
+@cached_figure('visitor_forecast')
+def visitor_forecast_figure(city, model):
+    historical_data = load_store().city(city)['monthly_visitors'].values
+    future_visitors = load_forecaster(model).predict(city)
+
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        y=historical_data,
+        name="Historical",
+        line=dict(color="#4CAF50")
+    ))
+    fig.add_trace(go.Scatter(
+        y=future_visitors,
+        name="Predicted",
+        line=dict(color="#FFA500", dash="dash")
+    ))
+    fig.update_layout(
+        title="Visitor Trend and Prediction",
+        xaxis_title="Months",
+        yaxis_title="Visitors",
+        template="plotly_dark",
+        showlegend=True,
+        legend=LEGEND_TOP
+    )
+    return fig
+
+@cached_figure('top_places')
+def top_places_figure(city, n=5):
+    top_places = load_store().city(city).nlargest(n, 'monthly_visitors')
+    return px.bar(
+        top_places,
+        x='place_name',
+        y='monthly_visitors',
+        title=f"Top {n} Busiest Places",
+        labels={'place_name': 'Place', 'monthly_visitors': 'Monthly Visitors'},
+        template="plotly_dark",
+        color='monthly_visitors',
+        color_continuous_scale='Viridis'
+    )
+
+@cached_figure('temperature_gauge')
+def temperature_gauge_figure(city):
+    city_weather = load_cube().weather.loc[city]
+    min_temp, max_temp = float(city_weather['temp_min']), float(city_weather['temp_max'])
+
+    fig = go.Figure()
+    fig.add_trace(go.Indicator(
+        mode="gauge+number",
+        value=(min_temp + max_temp) / 2,
+        title={'text': "Average Temperature (°C)"},
+        gauge={
+            'axis': {'range': [min_temp, max_temp]},
+            'bar': {'color': "#4CAF50"},
+            'steps': [
+                {'range': [min_temp, (min_temp + max_temp)/2], 'color': "lightgray"},
+                {'range': [(min_temp + max_temp)/2, max_temp], 'color': "gray"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': (min_temp + max_temp) / 2
+            }
+        }
+    ))
+    return fig
+
+@cached_figure('category_pie')
+def category_pie_figure(city):
+    category_counts = load_cube().categories([city]).set_index('category')['places'].sort_values(ascending=False)
+    fig = px.pie(
+        values=category_counts.values,
+        names=category_counts.index,
+        title="Category Distribution",
+        template="plotly_dark",
+        hole=0.4
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    return fig
+
+@cached_figure('type_bar')
+def type_bar_figure(city):
+    type_counts = load_cube().types([city]).set_index('type')['places'].sort_values(ascending=False)
+    return px.bar(
+        x=type_counts.index,
+        y=type_counts.values,
+        title="Type Distribution",
+        labels={'x': 'Type', 'y': 'Count'},
+        template="plotly_dark",
+        color=type_counts.values,
+        color_continuous_scale='Viridis'
+    )
+
+@cached_figure('place_clusters')
+def place_cluster_figure(city, level):
+    # One marker per grid cell, so the payload is bounded by MAX_MARKERS
+    clusters = load_clusters().markers(city, level)
+    fig = px.scatter(
+        clusters,
+        x='longitude',
+        y='latitude',
+        color='category',
+        size='visitors',
+        hover_name='top_place',
+        hover_data={'places': True, 'visitors': ':,', 'latitude': ':.4f', 'longitude': ':.4f'},
+        title="Place Distribution Map",
+        template="plotly_dark"
+    )
+    fig.update_layout(
+        showlegend=True,
+        legend=LEGEND_TOP
+    )
+    return fig
+
+@cached_figure('city_visitors')
+def city_visitors_figure(cities):
+    city_visitors = load_cube().totals(cities)['visitors']
+    return px.bar(
+        x=city_visitors.index,
+        y=city_visitors.values,
+        title="Total Monthly Visitors by City",
+        labels={'x': 'City', 'y': 'Monthly Visitors'},
+        template="plotly_dark",
+        color=city_visitors.values,
+        color_continuous_scale='Viridis'
+    )
+
+@cached_figure('city_categories')
+def city_categories_figure(cities):
+    category_data = load_cube().categories(cities).rename(columns={'visitors': 'monthly_visitors'})
+    return px.bar(
+        category_data,
+        x='city',
+        y='monthly_visitors',
+        color='category',
+        title="Category Distribution by City",
+        labels={'x': 'City', 'y': 'Monthly Visitors'},
+        template="plotly_dark",
+        barmode='group'
+    )
+
+@cached_figure('city_rainfall')
+def city_rainfall_figure(cities):
+    weather_data = load_cube().weather_for(cities).reset_index()
+    return px.bar(
+        weather_data,
+        x='city',
+        y='historical_rainfall',
+        template="plotly_dark",
+        color='historical_rainfall',
+        color_continuous_scale='Viridis'
+    )
@@ -0,0 +1,175 @@
+import numpy as np
+import streamlit as st
+
+from tourism import PlaceStore
+from tourism.assets import place_image_url
+from tourism.ingest import load_places
+from tourism.metrics import METRICS_FILE, REGISTRY, span, timed
+
+# Helper functions
+def create_metric_card(title, value, delta=None):
+    return f"""
+    <div class="metric-card fade-in">
+        <div class="metric-value">{value}</div>
+        <div class="metric-label">{title}</div>
+        {f'<div class="metric-delta">{delta}</div>' if delta else ''}
+    </div>
+    """
+
+@timed()
+def create_place_card(place):
+    # Thumbnail is resized once and served as a cacheable static file
+    image_url = place_image_url(place['place_name'])
+    distance = ''
+    if 'distance_km' in place:
+        distance = f"\n                <p><strong>Distance:</strong> {place['distance_km']:.1f} km</p>"
+    
+    return f"""
+    <div class="place-card fade-in">
+        <div class="place-image" style="background-image: url('{image_url}')"></div>
+        <div class="place-content">
+            <h3>{place['place_name']}</h3>
+            <div class="place-details">
+                <p><strong>Category:</strong> {place['category']}</p>
+                <p><strong>Type:</strong> {place['type']}</p>
+                <p><strong>Monthly Visitors:</strong> {place['monthly_visitors']:,}</p>
+                <p><strong>Best Time:</strong> {place['best_time_to_visit']}</p>{distance}
+            </div>
+        </div>
+    </div>
+    """
+
+PAGE_SIZES = [12, 24, 48, 96]
+
+SORT_OPTIONS = {
+    "Relevance": None,
+    "Most Visited": ('monthly_visitors', False),
+    "Nearest": ('distance_km', True),
+    "Name": ('place_name', True),
+}
+
+@timed()
+def sort_places(places, sort_by, query_key):
+    # Sorted order is computed once per result set and reused while paging
+    cache = st.session_state.setdefault('place_sort_cache', {})
+    key = (query_key, sort_by)
+    if key not in cache:
+        cache.clear()
+        column, ascending = SORT_OPTIONS[sort_by] or (None, True)
+        if column is None:
+            order = np.arange(len(places))
+        elif column == 'place_name':
+            order = np.argsort(places[column].str.lower().to_numpy(), kind='stable')
+        else:
+            values = places[column].to_numpy()
+            order = np.argsort(values if ascending else -values, kind='stable')
+        cache[key] = order
+    return places.iloc[cache[key]]
+
+@timed()
+def create_place_grid(places):
+    # Cards are stripped so no blank line ends the HTML block early
+    cards = "\n".join(create_place_card(place).strip() for place in places.to_dict('records'))
+    return f'<div class="place-grid">{cards}</div>'
+
+@timed()
+def render_place_grid(places, query_key):
+    sort_options = [name for name, spec in SORT_OPTIONS.items() if spec is None or spec[0] in places]
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        sort_by = st.selectbox("Sort By", sort_options)
+    with col2:
+        page_size = st.selectbox("Places per Page", PAGE_SIZES, index=1)
+    num_pages = max(1, -(-len(places) // page_size))
+    with col3:
+        page_number = st.number_input("Page", min_value=1, max_value=num_pages, value=1)
+    
+    start = (page_number - 1) * page_size
+    page = sort_places(places, sort_by, query_key).iloc[start:start + page_size]
+    st.caption(f"Showing {start + 1 if len(page) else 0}–{start + len(page)} of {len(places):,} places")
+    st.markdown(create_place_grid(page), unsafe_allow_html=True)
+
+def render_metrics_panel(page):
+    # Only shown when the app runs with TOURISM_METRICS=1
+    rows = REGISTRY.summary(page)
+    with st.sidebar.expander("⏱️ Timings", expanded=False):
+        if rows:
+            st.dataframe(rows, hide_index=True, column_order=['span', 'count', 'mean_ms', 'p50_ms', 'p95_ms'])
+        else:
+            st.caption("No spans recorded yet")
+        st.caption(f"Prometheus file: {METRICS_FILE}")
+
+# Load data
+@timed()
+@st.cache_resource
+def load_data():
+    # Memory-mapped Arrow snapshot when tourism.ingest has built one
+    return load_places()
+
+@st.cache_resource
+def load_store():
+    return PlaceStore(load_data())
+
+@st.cache_resource
+def _cube_holder():
+    return {}
+
+def load_cube():
+    from tourism.aggregates import AggregateCube
+
+    # Built once per store; a reloaded store refreshes only the changed rows
+    store = load_store()
+    holder = _cube_holder()
+    if holder.get('store') is not store:
+        cube = holder.get('cube')
+        holder['cube'] = AggregateCube(store.df) if cube is None else cube.refresh(store.df)
+        holder['store'] = store
+    return holder['cube']
+
+@st.cache_resource
+def load_forecaster(model='linear'):
+    from tourism.forecast import Forecaster
+
+    # One batched fit covers every city; switching cities is a lookup
+    store = load_store()
+    with span('forecast.fit'):
+        return Forecaster(store, model)
+
+@st.cache_resource
+def load_recommender():
+    from tourism.recommend import Recommender
+
+    return Recommender(load_store())
+
+@st.cache_resource
+def load_matrices():
+    from tourism.matrices import MatrixStore
+
+    # Memory-mapped per-city matrices built by tourism.matrices, if present
+    return MatrixStore()
+
+@st.cache_resource
+def load_search_index():
+    from tourism.search import SearchIndex
+
+    # Built once per store; each query touches only the index
+    return SearchIndex(load_store())
+
+@st.cache_resource
+def load_clusters():
+    from tourism.clusters import ClusterIndex
+
+    return ClusterIndex(load_store())
+
+@timed()
+def generate_schedule(places, day_hours, month=None, pace=1.0, day_start=9.0, time_budget=0.5):
+    from tourism.schedule import cached_schedule, visit_durations
+
+    # Crowd- and season-aware days with visit times; single-city trips read
+    # the prebuilt distance matrix, and plans are shared across sessions
+    distances = load_matrices().for_places(places)
+    visit_minutes = visit_durations(places) * pace
+    return cached_schedule(
+        places, day_hours, month, visit_minutes, day_start, time_budget,
+        version=load_store().version, distances=distances,
+    )
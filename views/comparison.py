@@ -0,0 +1,51 @@
+import streamlit as st
+
+from views.charts import city_categories_figure, city_rainfall_figure, city_visitors_figure
+from views.common import create_metric_card, load_cube, load_store
+
+
+def render():
+    store = load_store()
+    cube = load_cube()
+
+    st.title("City Comparison")
+    
+    # Enhanced city selection
+    selected_cities = st.multiselect(
+        "Select Cities to Compare",
+        options=store.cities,
+        default=store.cities[:2],
+        format_func=lambda x: f"🏙️ {x}"
+    )
+    
+    if len(selected_cities) >= 2:
+        # Compare total visitors with enhanced visualization
+        st.subheader("Total Visitors Comparison")
+        fig = city_visitors_figure(tuple(selected_cities))
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Compare category distribution with enhanced visualization
+        st.subheader("Category Distribution Comparison")
+        fig = city_categories_figure(tuple(selected_cities))
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Compare weather conditions with enhanced cards
+        st.subheader("Weather Conditions Comparison")
+        weather_data = cube.weather_for(selected_cities).reset_index()
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write("Historical Rainfall (mm)")
+            fig = city_rainfall_figure(tuple(selected_cities))
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            st.write("Temperature Range (°C)")
+            for _, row in weather_data.iterrows():
+                st.markdown(
+                    create_metric_card(
+                        row['city'],
+                        row['temperature_trend']
+                    ),
+                    unsafe_allow_html=True
+                )
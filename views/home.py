@@ -0,0 +1,63 @@
+import streamlit as st
+
+from views.common import create_metric_card, load_cube, load_store
+
+
+def render():
+    store = load_store()
+
+    st.title("Welcome to Tourist Place Recommender")
+    
+    # Hero section with background image
+    st.markdown("""
+        <div class="hero-section fade-in">
+            <h2>Explore India's Finest Destinations</h2>
+            <p>Plan your perfect trip with our comprehensive travel guide</p>
+            <div class="hero-buttons">
+                <a href="#cities" class="hero-button">Explore Cities</a>
+                <a href="#features" class="hero-button secondary">Learn More</a>
+            </div>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # Features section
+    st.markdown("""
+        <div id="features" class="features-section animate-on-scroll">
+            <h2>Why Choose Us?</h2>
+            <div class="features-grid">
+                <div class="feature-card">
+                    <i class="fas fa-map-marked-alt"></i>
+                    <h3>Smart Recommendations</h3>
+                    <p>Get personalized recommendations based on your preferences</p>
+                </div>
+                <div class="feature-card">
+                    <i class="fas fa-route"></i>
+                    <h3>Optimal Itineraries</h3>
+                    <p>Plan your perfect trip with our intelligent itinerary generator</p>
+                </div>
+                <div class="feature-card">
+                    <i class="fas fa-chart-line"></i>
+                    <h3>Real-time Analytics</h3>
+                    <p>Make informed decisions with our comprehensive analytics</p>
+                </div>
+            </div>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    # Display available cities with enhanced metrics
+    st.markdown('<div id="cities">', unsafe_allow_html=True)
+    st.subheader("Available Cities")
+    cities = store.cities
+    city_totals = load_cube().totals(cities)
+    cols = st.columns(4)
+    for idx, (city, totals) in enumerate(city_totals.iterrows()):
+        with cols[idx % 4]:
+            st.markdown(
+                create_metric_card(
+                    city,
+                    f"{totals['visitors']:,}",
+                    f"{totals['places']} places"
+                ),
+                unsafe_allow_html=True
+            )
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,101 @@
+import datetime
+
+import streamlit as st
+
+from tourism.seasons import MONTHS
+from views.common import generate_schedule, load_store
+
+PACES = {"Relaxed": 1.25, "Normal": 1.0, "Quick": 0.75}
+
+def format_time(minutes):
+    return f"{int(minutes) // 60:02d}:{int(minutes) % 60:02d}"
+
+def crowd_label(level):
+    if level < 0.3:
+        return "🟢 Quiet"
+    if level < 0.6:
+        return "🟡 Moderate"
+    return "🔴 Busy"
+
+def render():
+    store = load_store()
+
+    st.title("Itinerary Planner")
+
+    # Enhanced city selection
+    selected_cities = st.multiselect(
+        "Select Cities",
+        store.cities,
+        default=store.cities[:1],
+        format_func=lambda x: f"🏙️ {x}",
+        help="Days are split between the cities in the order chosen"
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        # Number of days with enhanced UI
+        num_days = st.number_input(
+            "Number of Days",
+            min_value=1,
+            max_value=14,
+            value=3,
+            help="Choose how many days you want to spend travelling"
+        )
+        travel_month = st.selectbox(
+            "Travel Month",
+            list(range(1, 13)),
+            index=datetime.date.today().month - 1,
+            format_func=lambda m: MONTHS[m - 1],
+            help="Places out of their best season are valued lower"
+        )
+    with col2:
+        day_start, day_end = st.slider(
+            "Sightseeing Hours",
+            min_value=6,
+            max_value=22,
+            value=(9, 17),
+            help="Hours available each day"
+        )
+        pace = st.select_slider("Pace", options=list(PACES), value="Normal")
+
+    if st.button("Generate Itinerary", help="Click to generate your personalized itinerary"):
+        if not selected_cities or day_end <= day_start:
+            st.warning("Choose at least one city and a non-empty range of hours.")
+            return
+        trip_places = store.cities_frame(selected_cities)
+
+        # Assign places to days and times around opening hours and crowds
+        schedule = generate_schedule(
+            trip_places,
+            [day_end - day_start] * num_days,
+            month=travel_month,
+            pace=PACES[pace],
+            day_start=day_start
+        )
+
+        st.subheader(f"{num_days}-Day Itinerary for {', '.join(selected_cities)}")
+
+        for day, route in enumerate(schedule):
+            city = route.places['city'].iloc[0] if len(route.places) else "Free day"
+            travel = route.places['travel_minutes'].sum() if len(route.places) else 0
+            st.markdown(f"""
+                <div class="itinerary-day fade-in">
+                    <h3>Day {day + 1} · {city}</h3>
+                    <p>Travel distance: {route.distance_km:.1f} km ({travel:.0f} min on the road)</p>
+            """, unsafe_allow_html=True)
+
+            for _, place in route.places.iterrows():
+                st.markdown(f"""
+                    <div class="place-card">
+                        <h4>{format_time(place['start'])}–{format_time(place['end'])} · {place['place_name']}</h4>
+                        <div class="place-details">
+                            <p><strong>Category:</strong> {place['category']}</p>
+                            <p><strong>Type:</strong> {place['type']}</p>
+                            <p><strong>Best Time to Visit:</strong> {place['best_time_to_visit']}</p>
+                            <p><strong>Expected Crowd:</strong> {crowd_label(place['crowd'])}</p>
+                            <p><strong>Expected Visitors:</strong> {place['monthly_visitors']:,}</p>
+                        </div>
+                    </div>
+                """, unsafe_allow_html=True)
+
+            st.markdown("</div>", unsafe_allow_html=True)
@@ -0,0 +1,162 @@
+import streamlit as st
+
+from tourism.seasons import MONTHS
+from views.common import load_recommender, load_search_index, load_store, render_place_grid
+
+
+def render():
+    store = load_store()
+
+    st.title("Tourist Place Recommender")
+    
+    search_mode = st.radio(
+        "Search Mode",
+        ["By City", "Search", "Near a Point", "More Like This", "For You"],
+        horizontal=True
+    )
+    
+    if search_mode == "By City":
+        # Enhanced city selection
+        selected_city = st.selectbox(
+            "Select a City",
+            store.cities,
+            format_func=lambda x: f"🏙️ {x}"
+        )
+        
+        # Filter options for selected city
+        city_categories = store.values('category', selected_city)
+        city_types = store.values('type', selected_city)
+        
+        # Advanced filters
+        col1, col2 = st.columns(2)
+        with col1:
+            selected_category = st.multiselect(
+                "Filter by Category",
+                options=city_categories,
+                default=city_categories
+            )
+        with col2:
+            selected_type = st.multiselect(
+                "Filter by Type",
+                options=city_types,
+                default=city_types
+            )
+        
+        visit_month = st.selectbox(
+            "Good to Visit In",
+            [None] + list(range(1, 13)),
+            format_func=lambda m: "Any Month" if m is None else MONTHS[m - 1]
+        )
+        
+        # Apply filters
+        filtered_places = store.filter(selected_city, selected_category, selected_type, month=visit_month)
+        results_title = f"Top Places in {selected_city}"
+        query_key = ('city', selected_city, tuple(selected_category), tuple(selected_type), visit_month)
+    elif search_mode == "Search":
+        # Prefix and typo-tolerant matches over names, cities, categories and types
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            search_query = st.text_input(
+                "Search Places",
+                placeholder="e.g. red fort, goa beach, tmple"
+            )
+        with col2:
+            max_results = st.slider("Maximum Places", min_value=1, max_value=500, value=48)
+        filtered_places = load_search_index().search(search_query, k=max_results)
+        results_title = f"Results for “{search_query.strip()}”" if search_query.strip() else "Start typing to search"
+        query_key = ('search', search_query, max_results)
+    elif search_mode == "Near a Point":
+        # Spatial index lookup around a chosen point
+        first_place = store.df.iloc[0]
+        col1, col2 = st.columns(2)
+        with col1:
+            latitude = st.number_input(
+                "Latitude",
+                min_value=-90.0,
+                max_value=90.0,
+                value=float(first_place['latitude']),
+                format="%.4f"
+            )
+        with col2:
+            longitude = st.number_input(
+                "Longitude",
+                min_value=-180.0,
+                max_value=180.0,
+                value=float(first_place['longitude']),
+                format="%.4f"
+            )
+        col1, col2 = st.columns(2)
+        with col1:
+            radius_km = st.slider("Radius (km)", min_value=1, max_value=500, value=25)
+        with col2:
+            max_results = st.slider("Maximum Places", min_value=1, max_value=500, value=24)
+        
+        filtered_places = store.near(latitude, longitude, radius_km=radius_km, k=max_results)
+        results_title = f"Places within {radius_km} km"
+        query_key = ('near', latitude, longitude, radius_km, max_results)
+    elif search_mode == "More Like This":
+        recommender = load_recommender()
+        # Scoped to one city so only its places are sent to the browser
+        col1, col2 = st.columns(2)
+        with col1:
+            seed_city = st.selectbox(
+                "City",
+                store.cities,
+                format_func=lambda x: f"🏙️ {x}"
+            )
+        with col2:
+            city_rows = store.city_slice(seed_city)
+            place_names = store.df['place_name'].iloc[city_rows].to_numpy()
+            place_position = st.selectbox(
+                "Select a Place",
+                range(city_rows.start, city_rows.stop),
+                format_func=lambda i: place_names[i - city_rows.start]
+            )
+        max_results = st.slider("Maximum Places", min_value=1, max_value=500, value=24)
+        filtered_places = recommender.similar(place_position, k=max_results)
+        results_title = f"Places like {store.df['place_name'].iat[place_position]}"
+        query_key = ('similar', place_position, max_results)
+    else:
+        # Preference-weighted ranking across any number of cities
+        recommender = load_recommender()
+        col1, col2 = st.columns(2)
+        with col1:
+            preferred_categories = st.multiselect("Preferred Categories", options=recommender.categories)
+            preferred_cities = st.multiselect(
+                "Cities",
+                options=store.cities,
+                help="Leave empty to search every city"
+            )
+        with col2:
+            preferred_types = st.multiselect("Preferred Types", options=recommender.types)
+            travel_month = st.selectbox(
+                "Travel Month",
+                [None] + list(range(1, 13)),
+                format_func=lambda m: "Any" if m is None else MONTHS[m - 1]
+            )
+        popularity = st.slider("Prefer Popular Places", min_value=0.0, max_value=1.0, value=0.3)
+        max_results = st.slider("Maximum Places", min_value=1, max_value=500, value=24)
+        filtered_places = recommender.rank(
+            preferred_categories,
+            preferred_types,
+            month=travel_month,
+            popularity=popularity,
+            cities=preferred_cities,
+            k=max_results
+        )
+        results_title = "Recommended for You"
+        query_key = (
+            'rank',
+            tuple(preferred_categories),
+            tuple(preferred_types),
+            travel_month,
+            popularity,
+            tuple(preferred_cities),
+            max_results
+        )
+    
+    # Display top places with enhanced cards
+    st.subheader(results_title)
+    
+    # One page of cards rendered as a single HTML block
+    render_place_grid(filtered_places, query_key)